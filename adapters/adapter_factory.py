@@ -5,6 +5,8 @@
 """
 import re
 import hashlib
+import threading
+from functools import lru_cache
 from typing import Dict, List, Optional, Type
 
 from adapters.base_adapter import BaseCloudDriveAdapter
@@ -41,10 +43,17 @@ class AdapterFactory:
 
     # 实例缓存: (drive_type, cookie_hash) -> adapter_instance
     _instance_cache: Dict[str, BaseCloudDriveAdapter] = {}
-
-    @classmethod
-    def _make_cache_key(cls, drive_type: str, cookie: str) -> str:
-        """生成缓存键"""
+    # 按缓存键串行化实例创建：部分网盘构造时即刷新 token（refresh_token 一次性），
+    # 并发创建同一账户会互相作废对方的 token。锁随进程常驻，清空实例缓存时不清理
+    _create_locks: Dict[str, threading.Lock] = {}
+    _create_locks_guard = threading.Lock()
+    # 正在后台预建的缓存键，同一账户同时只保留一个预建线程
+    _warming: set = set()
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _make_cache_key(drive_type: str, cookie: str) -> str:
+        """生成缓存键（纯函数，结果按参数记忆，重复查找同一账户时免去 MD5 计算）"""
         cookie_hash = hashlib.md5(cookie.encode("utf-8")).hexdigest()[:16]
         return f"{drive_type}:{cookie_hash}"
 
@@ -93,19 +102,68 @@ class AdapterFactory:
         if cached is not None:
             return cached
 
-        # 创建新实例并缓存
-        try:
-            adapter = adapter_class(cookie=cookie, index=index)
-            cls._instance_cache[cache_key] = adapter
-            return adapter
-        except Exception as e:
-            print(f"创建适配器失败: {e}")
-            return None
+        with cls._create_locks_guard:
+            create_lock = cls._create_locks.setdefault(cache_key, threading.Lock())
+        with create_lock:
+            cached = cls._instance_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+            # 创建新实例并缓存
+            try:
+                adapter = adapter_class(cookie=cookie, index=index)
+                cls._instance_cache[cache_key] = adapter
+                return adapter
+            except Exception as e:
+                print(f"创建适配器失败: {e}")
+                return None
+
+    @classmethod
+    def cache_adapter(cls, drive_type: str, cookie: str, adapter: BaseCloudDriveAdapter):
+        """
+        将已初始化的适配器放入缓存（如刚刷新完 token 的实例），后续请求直接复用
+        Args:
+            drive_type: 网盘类型
+            cookie: 该实例对应的认证 cookie
+            adapter: 适配器实例
+        """
+        cls._instance_cache[cls._make_cache_key(drive_type, cookie)] = adapter
+
+    @classmethod
+    def warm(cls, drive_type: str, cookie: str, index: int = 0):
+        """
+        在后台线程中预先创建适配器实例，避免缓存清空后的首个请求承担初始化耗时
+        Args:
+            drive_type: 网盘类型
+            cookie: 认证 cookie
+            index: 账户索引
+        """
+        cache_key = cls._make_cache_key(drive_type, cookie)
+        with cls._create_locks_guard:
+            if cache_key in cls._warming or cache_key in cls._instance_cache:
+                return
+            cls._warming.add(cache_key)
+
+        def _warm():
+            try:
+                cls.create_adapter(drive_type, cookie, index)
+            finally:
+                with cls._create_locks_guard:
+                    cls._warming.discard(cache_key)
+
+        threading.Thread(target=_warm, daemon=True).start()
 
     @classmethod
     def clear_cache(cls):
         """清空实例缓存（配置更新时调用）"""
+        # 先取快照再清空，其他线程同时创建实例也不会打断遍历
+        adapters = list(cls._instance_cache.values())
         cls._instance_cache.clear()
+        for adapter in adapters:
+            try:
+                adapter.close()
+            except Exception as e:
+                print(f"关闭适配器失败: {e}")
 
     @classmethod
     def get_drive_type_by_url(cls, url: str) -> Optional[str]:
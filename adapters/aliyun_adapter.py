@@ -62,8 +62,8 @@ NEWLOGIN_QRCODE_QUERY_DO = "/newlogin/qrcode/query.do"
 
 def _config_saver_factory(config_path: str):
     """创建配置保存函数"""
-    def save_config(new_refresh_token: str, account_name: str = None):
-        """保存新的 refresh_token 到配置文件"""
+    def save_config(new_refresh_token: str, account_name: str = None, adapter=None):
+        """保存新的 refresh_token 到配置文件（adapter 为发起刷新的实例，此处不使用）"""
         try:
             from quark_auto_save import Config
             config = Config.read_json(config_path)
@@ -258,7 +258,7 @@ class AliyunAdapter(BaseCloudDriveAdapter):
         """保存新的 refresh_token 到配置文件"""
         global _global_config_saver
         if _global_config_saver:
-            _global_config_saver(self._refresh_token, self._account_name)
+            _global_config_saver(self._refresh_token, self._account_name, adapter=self)
 
     def _ensure_token_valid(self) -> bool:
         """确保 token 有效"""
@@ -912,7 +912,9 @@ class AliyunAdapter(BaseCloudDriveAdapter):
                         "fid": item_id,
                         "name": item.get("name", ""),
                     })
-            return path.reverse()
+            # 接口按当前目录 -> 根目录返回，面包屑需从根目录开始
+            path.reverse()
+            return path
         except Exception as e:
             logging.debug(f"[Aliyun] 获取文件路径失败: {e}")
             return []
@@ -1095,7 +1097,7 @@ class AliyunAdapter(BaseCloudDriveAdapter):
 
 
 # 设置全局配置保存函数的工厂方法
-def set_config_saver(config_path: str):
-    """设置配置保存函数"""
+def set_config_saver(config_path: str, saver: Optional[Callable] = None):
+    """设置配置保存函数；传入 saver 时直接使用（如 WebUI 需经自身的配置锁写盘）"""
     global _global_config_saver
-    _global_config_saver = _config_saver_factory(config_path)
+    _global_config_saver = saver or _config_saver_factory(config_path)
@@ -168,6 +168,10 @@ class BaseCloudDriveAdapter(ABC):
         """获取账户信息（可选实现）"""
         return False
 
+    def close(self):
+        """释放后台线程等资源（可选实现，实例被丢弃前调用）"""
+        pass
+
     def update_savepath_fid(self, tasklist: List[Dict]) -> bool:
         """
         更新保存路径的 fid 映射
@@ -6,12 +6,61 @@
 import re
 import time
 import logging
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from cachetools import TTLCache
 from typing import Dict, List, Tuple, Optional, Any
 from datetime import datetime
 
 from adapters.base_adapter import BaseCloudDriveAdapter
 
+# orjson 直接解析 bytes，速度明显快于标准库；未安装时回退到 json
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+
+
+class _SessionTTLCache(TTLCache):
+    """被淘汰（容量满或过期）时关闭 session 的 TTLCache，释放其连接池"""
+
+    def popitem(self):
+        key, session = super().popitem()
+        session.close()
+        return key, session
+
+    def expire(self, time=None):
+        # 旧版 cachetools 的 expire 不返回过期条目，此时无法逐个关闭
+        expired = super().expire(time)
+        for _, session in expired or ():
+            session.close()
+        return expired
+
+
+# 分享链接解析
+_RE_SHARE_CODE = re.compile(r"(?:115|anxia|115cdn)\.com/s/([^?#\s&]+)")
+_RE_PWD = re.compile(r"password=([^&#\s]+)")
+_RE_HASH = re.compile(r"#([^&#\s/]+)")
+_RE_FID = re.compile(r"(\w+)")
+# 文件名模糊匹配时去除的特殊字符
+_RE_FNAME_CLEAN = re.compile(r"[^\w\s\.]")
+
+# 文件扩展名 -> 类别
+_EXT_CATEGORY = {
+    ext: cat
+    for cat, exts in {
+        "video": ("mp4", "mkv", "avi", "mov", "wmv", "flv", "rmvb", "ts"),
+        "audio": ("mp3", "wav", "flac", "aac", "ogg"),
+        "image": ("jpg", "jpeg", "png", "gif", "bmp", "webp"),
+        "doc": ("doc", "docx", "pdf", "txt", "xls", "xlsx", "ppt", "pptx"),
+        "archive": ("zip", "rar", "7z", "tar", "gz"),
+    }.items()
+    for ext in exts
+}
+
 
 class Cloud115Adapter(BaseCloudDriveAdapter):
     """115网盘适配器"""
@@ -31,6 +80,11 @@ class Cloud115Adapter(BaseCloudDriveAdapter):
         "MicroMessenger/6.8.0(0x16080000) NetType/WIFI MiniProgramEnv/Mac "
         "MacWechat/WMPF MacWechat/3.8.9(0x13080910) XWEB/1227"
     )
+    # 分享浏览并发请求数（BFS 同层目录 / 多分页）
+    SHARE_MAX_WORKERS = 8
+    # 转存后轮询目标目录的间隔与超时（秒）
+    SAVE_POLL_INTERVAL = 0.3
+    SAVE_POLL_TIMEOUT = 5
 
     def __init__(self, cookie: str = "", index: int = 0):
         super().__init__(cookie, index)
@@ -44,24 +98,50 @@ class Cloud115Adapter(BaseCloudDriveAdapter):
             "Origin": "https://115.com",
             "Referer": "https://115.com",
         })
-        # 解析 cookie 字符串并设置到 session
+        # 解析 cookie 字符串并设置到 session（解析结果供转存 session 复用）
+        self._cookie_dict: Dict[str, str] = {}
         if cookie:
             for kv in cookie.split(";"):
                 kv = kv.strip()
                 if "=" in kv:
                     k, v = kv.split("=", 1)
-                    self.auth_session.cookies.set(k.strip(), v.strip())
+                    self._cookie_dict[k.strip()] = v.strip()
+        self.auth_session.cookies.update(self._cookie_dict)
+        self._mount_http_adapter(self.auth_session)
+
+        # 分享浏览 session 缓存: (share_code, receive_code) -> session
+        self._share_sessions: TTLCache = _SessionTTLCache(maxsize=32, ttl=1800)
+        self._share_sessions_lock = threading.Lock()
+
+        # ls_dir 短期缓存（供 get_fids 逐级解析路径复用）: pdir_fid -> {file_name: item}
+        self._ls_cache: TTLCache = TTLCache(maxsize=256, ttl=30)
+        self._ls_cache_lock = threading.Lock()
 
     # ----------------------------------------------------------------
     #  HTTP 基础方法
     # ----------------------------------------------------------------
 
-    def _create_share_session(self, share_code: str, receive_code: str = ""):
+    @staticmethod
+    def _mount_http_adapter(session: requests.Session) -> None:
+        """挂载带连接池的 HTTPAdapter，复用 keep-alive 连接，避免频繁 TCP+TLS 握手"""
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=3)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+    def _get_share_session(self, share_code: str, receive_code: str = ""):
         """
-        创建用于浏览分享链接的独立空 session（不携带用户 cookie）。
-        先访问分享页面获取必要的 session cookie，然后用它来请求分享 API。
+        获取用于浏览分享链接的独立空 session（不携带用户 cookie）。
+        同一 (share_code, receive_code) 复用已缓存的 session，仅在首次创建时
+        访问分享页面获取必要的 session cookie。
         """
+        key = (share_code, receive_code)
+        with self._share_sessions_lock:
+            share_session = self._share_sessions.get(key)
+        if share_session is not None:
+            return share_session
+
         share_session = requests.Session()
+        self._mount_http_adapter(share_session)
         share_session.headers.update({
             "User-Agent": self.USER_AGENT,
             "Accept": "*/*",
@@ -75,15 +155,29 @@ class Cloud115Adapter(BaseCloudDriveAdapter):
                 timeout=15,
             )
         except Exception as e:
+            # 预热失败不缓存，下次调用时重新建立
             logging.warning(f"[115] 访问分享页面失败: {e}")
+            return share_session
+        with self._share_sessions_lock:
+            # 并发创建时保留先入缓存的 session，关闭本次新建的
+            existing = self._share_sessions.get(key)
+            if existing is None:
+                self._share_sessions[key] = share_session
+        if existing is not None:
+            share_session.close()
+            return existing
         return share_session
 
     def _safe_json(self, response) -> Dict:
-        """安全解析 JSON 响应"""
+        """
+        安全解析 JSON 响应。
+        直接解析原始 bytes（115 返回 UTF-8），不经过 response.text 的编码探测。
+        """
         try:
-            return response.json()
+            return json_loads(response.content)
         except Exception as e:
-            content = response.text[:200] if response.text else "(empty)"
+            raw = response.content or b""
+            content = raw[:200].decode("utf-8", "replace") if raw else "(empty)"
             logging.warning(f"[115] JSON解析失败: {e}, 响应: {content}")
             return {
                 "state": False,
@@ -94,6 +188,11 @@ class Cloud115Adapter(BaseCloudDriveAdapter):
     def _fake_error(self, msg: str = "request error") -> Dict:
         return {"state": False, "code": 500, "error": msg}
 
+    @staticmethod
+    def _list_error(message: str) -> Dict:
+        """列表类接口（get_detail / ls_dir）的失败返回"""
+        return {"code": 1, "message": message, "data": {"list": []}}
+
     # ----------------------------------------------------------------
     #  账户相关
     # ----------------------------------------------------------------
@@ -132,7 +231,7 @@ class Cloud115Adapter(BaseCloudDriveAdapter):
         passcode = receive_code
         使用独立空 session 访问，不携带用户 cookie。
         """
-        share_session = self._create_share_session(pwd_id, passcode)
+        share_session = self._get_share_session(pwd_id, passcode)
         url = (
             f"{self.WEB_URL}/webapi/share/snap"
             f"?share_code={pwd_id}&offset=0&limit=20&asc=0"
@@ -177,7 +276,7 @@ class Cloud115Adapter(BaseCloudDriveAdapter):
         receive_code = parts[1] if len(parts) > 1 else ""
         cid = pdir_fid if pdir_fid and str(pdir_fid) != "0" else ""
 
-        share_session = self._create_share_session(share_code, receive_code)
+        share_session = self._get_share_session(share_code, receive_code)
 
         # 当请求了完整路径且 cid 不为根时，通过 BFS 解析路径
         full_path = []
@@ -187,38 +286,47 @@ class Cloud115Adapter(BaseCloudDriveAdapter):
             )
 
         list_merge = []
-        offset = 0
         limit = 50
+        url = f"{self.WEB_URL}/webapi/share/snap"
+        params = {
+            "share_code": share_code,
+            "offset": 0,
+            "limit": limit,
+            "asc": 0,
+            "cid": cid,
+            "receive_code": receive_code,
+            "format": "json",
+        }
 
         while True:
-            url = (
-                f"{self.WEB_URL}/webapi/share/snap"
-                f"?share_code={share_code}&offset={offset}&limit={limit}"
-                f"&asc=0&cid={cid}&receive_code={receive_code}&format=json"
-            )
             try:
-                resp = share_session.get(url, timeout=15)
+                resp = share_session.get(url, params=params, timeout=15)
                 data = self._safe_json(resp)
                 if not data.get("state"):
-                    return {
-                        "code": 1,
-                        "message": data.get("error", "获取分享信息失败"),
-                        "data": {"list": []},
-                    }
+                    return self._list_error(data.get("error", "获取分享信息失败"))
                 file_list = data.get("data", {}).get("list", [])
                 if not file_list:
                     break
-                for item in file_list:
-                    list_merge.append(self._convert_share_item(item))
+                list_merge.extend(map(self._convert_share_item, file_list))
                 if len(file_list) < limit:
                     break
-                offset += limit
+                # 首页返回了总数时，其余分页按 offset 并发请求
+                total = int(data.get("data", {}).get("count") or 0)
+                if params["offset"] == 0 and total > limit:
+                    pages = self._fetch_share_pages(
+                        share_session, url, params, range(limit, total, limit)
+                    )
+                    for page in pages:
+                        if not page.get("state"):
+                            return self._list_error(page.get("error", "获取分享信息失败"))
+                        list_merge.extend(map(
+                            self._convert_share_item,
+                            page.get("data", {}).get("list", []),
+                        ))
+                    break
+                params["offset"] += limit
             except Exception as e:
-                return {
-                    "code": 1,
-                    "message": f"获取分享详情失败: {e}",
-                    "data": {"list": []},
-                }
+                return self._list_error(f"获取分享详情失败: {e}")
 
         return {
             "code": 0,
@@ -230,6 +338,19 @@ class Cloud115Adapter(BaseCloudDriveAdapter):
             "metadata": {"_total": len(list_merge)},
         }
 
+    def _fetch_share_pages(
+        self, share_session, url: str, params: Dict, offsets
+    ) -> List[Dict]:
+        """并发请求分享目录的多个分页，按 offsets 顺序返回解析后的响应"""
+        def fetch(offset):
+            resp = share_session.get(
+                url, params={**params, "offset": offset}, timeout=15
+            )
+            return self._safe_json(resp)
+
+        with ThreadPoolExecutor(max_workers=self.SHARE_MAX_WORKERS) as executor:
+            return list(executor.map(fetch, offsets))
+
     def _resolve_share_path(
         self,
         share_session,
@@ -240,52 +361,41 @@ class Cloud115Adapter(BaseCloudDriveAdapter):
     ) -> List[Dict]:
         """
         在分享目录树中 BFS 查找 target_cid 的完整路径。
+        同一层级的目录并发请求，按提交顺序合并结果以保持 BFS 顺序。
         返回格式与 Quark full_path 一致: [{"fid": "...", "file_name": "..."}]
         """
         target_cid = str(target_cid)
         # queue 每项: (当前目录cid, 已累计的路径列表)
         queue = [("", [])]
 
-        for _ in range(max_depth):
-            next_queue = []
-            for current_cid, current_path in queue:
-                offset = 0
-                limit = 50
-                while True:
-                    url = (
-                        f"{self.WEB_URL}/webapi/share/snap"
-                        f"?share_code={share_code}&offset={offset}&limit={limit}"
-                        f"&asc=0&cid={current_cid}"
-                        f"&receive_code={receive_code}&format=json"
+        with ThreadPoolExecutor(max_workers=self.SHARE_MAX_WORKERS) as executor:
+            for _ in range(max_depth):
+                futures = [
+                    (
+                        current_path,
+                        executor.submit(
+                            self._list_share_subdirs,
+                            share_session, share_code, receive_code, current_cid,
+                            target_cid,
+                        ),
                     )
-                    try:
-                        resp = share_session.get(url, timeout=15)
-                        data = self._safe_json(resp)
-                        if not data.get("state"):
-                            break
-                        file_list = data.get("data", {}).get("list", [])
-                        if not file_list:
-                            break
-                        for item in file_list:
-                            is_dir = "fid" not in item
-                            if not is_dir:
-                                continue
-                            item_cid = str(item.get("cid", ""))
-                            item_name = item.get("n", "")
-                            new_path = current_path + [
-                                {"fid": item_cid, "file_name": item_name}
-                            ]
-                            if item_cid == target_cid:
-                                return new_path
-                            next_queue.append((item_cid, new_path))
-                        if len(file_list) < limit:
-                            break
-                        offset += limit
-                    except Exception:
-                        break
-            if not next_queue:
-                break
-            queue = next_queue
+                    for current_cid, current_path in queue
+                ]
+                next_queue = []
+                for current_path, future in futures:
+                    for item_cid, item_name in future.result():
+                        new_path = current_path + [
+                            {"fid": item_cid, "file_name": item_name}
+                        ]
+                        if item_cid == target_cid:
+                            # 已找到，取消尚未开始的请求
+                            for _, pending in futures:
+                                pending.cancel()
+                            return new_path
+                        next_queue.append((item_cid, new_path))
+                if not next_queue:
+                    break
+                queue = next_queue
 
         logging.warning(
             f"[115] _resolve_share_path: 未找到 cid={target_cid}，"
@@ -293,6 +403,55 @@ class Cloud115Adapter(BaseCloudDriveAdapter):
         )
         return []
 
+    def _list_share_subdirs(
+        self,
+        share_session,
+        share_code: str,
+        receive_code: str,
+        cid: str,
+        target_cid: str = "",
+    ) -> List[Tuple[str, str]]:
+        """
+        分页列出分享目录 cid 下的子文件夹，返回 [(cid, 名称)]。
+        指定 target_cid 时，在当前页命中后不再请求后续分页。
+        """
+        subdirs = []
+        limit = 50
+        url = f"{self.WEB_URL}/webapi/share/snap"
+        params = {
+            "share_code": share_code,
+            "offset": 0,
+            "limit": limit,
+            "asc": 0,
+            "cid": cid,
+            "receive_code": receive_code,
+            "format": "json",
+        }
+        while True:
+            try:
+                resp = share_session.get(url, params=params, timeout=15)
+                data = self._safe_json(resp)
+                if not data.get("state"):
+                    break
+                file_list = data.get("data", {}).get("list", [])
+                if not file_list:
+                    break
+                # 文件夹项没有 fid 字段
+                page_dirs = [
+                    (str(item.get("cid", "")), item.get("n", ""))
+                    for item in file_list
+                    if "fid" not in item
+                ]
+                subdirs.extend(page_dirs)
+                if target_cid and any(c == target_cid for c, _ in page_dirs):
+                    break
+                if len(file_list) < limit:
+                    break
+                params["offset"] += limit
+            except Exception:
+                break
+        return subdirs
+
     # ----------------------------------------------------------------
     #  用户网盘操作（使用带 cookie 的 auth_session）
     # ----------------------------------------------------------------
@@ -327,16 +486,11 @@ class Cloud115Adapter(BaseCloudDriveAdapter):
                 )
                 data = self._safe_json(resp)
                 if not data.get("state"):
-                    return {
-                        "code": 1,
-                        "message": data.get("error", "获取目录列表失败"),
-                        "data": {"list": []},
-                    }
+                    return self._list_error(data.get("error", "获取目录列表失败"))
                 file_list = data.get("data", [])
                 if not file_list:
                     break
-                for item in file_list:
-                    list_merge.append(self._convert_dir_item(item))
+                list_merge.extend(map(self._convert_dir_item, file_list))
                 # max_items 限量：达到上限后提前终止分页
                 if max_items > 0 and len(list_merge) >= max_items:
                     list_merge = list_merge[:max_items]
@@ -345,11 +499,7 @@ class Cloud115Adapter(BaseCloudDriveAdapter):
                     break
                 offset += limit
             except Exception as e:
-                return {
-                    "code": 1,
-                    "message": f"获取目录失败: {e}",
-                    "data": {"list": []},
-                }
+                return self._list_error(f"获取目录失败: {e}")
         logging.debug(f"[115] ls_dir result: {len(list_merge)} items")
         return {
             "code": 0,
@@ -358,6 +508,40 @@ class Cloud115Adapter(BaseCloudDriveAdapter):
             "metadata": {"_total": len(list_merge)},
         }
 
+    def _ls_dir_by_name(self, pdir_fid: str, no_cache: bool = False) -> Optional[Dict[str, Dict]]:
+        """
+        带短期缓存的 ls_dir，返回 {file_name: item} 映射（同名时保留首个）。
+        列目录失败返回 None，仅缓存成功结果；no_cache 为 True 时重新列目录并刷新缓存。
+        """
+        key = str(pdir_fid) if pdir_fid else "0"
+        if not no_cache:
+            with self._ls_cache_lock:
+                cached = self._ls_cache.get(key)
+            if cached is not None:
+                return cached
+        result = self.ls_dir(key)
+        if result.get("code") != 0:
+            return None
+        name_map = {
+            item.get("file_name"): item
+            for item in reversed(result.get("data", {}).get("list", []))
+        }
+        with self._ls_cache_lock:
+            self._ls_cache[key] = name_map
+        return name_map
+
+    def _invalidate_ls_cache(self, pdir_fid: str = None):
+        """
+        失效 ls_dir 缓存。
+        Args:
+            pdir_fid: 指定目录，None 时清空全部
+        """
+        with self._ls_cache_lock:
+            if pdir_fid is None:
+                self._ls_cache.clear()
+            else:
+                self._ls_cache.pop(str(pdir_fid) if pdir_fid else "0", None)
+
     def save_file(
         self,
         fid_list: List[str],
@@ -388,12 +572,17 @@ class Cloud115Adapter(BaseCloudDriveAdapter):
         receive_code = parts[1] if len(parts) > 1 else ""
 
         # --- 记录转存前目标目录的文件列表 ---
-        before_items = {}  # {fid: file_name}
+        before_fids = set()
+        # 快照失败时无法区分新旧文件，不能按新增数量判断到齐
+        before_ok = False
         try:
             before_dir = self.ls_dir(to_pdir_fid if to_pdir_fid else "0")
             if before_dir.get("code") == 0:
-                for item in before_dir.get("data", {}).get("list", []):
-                    before_items[item.get("fid", "")] = item.get("file_name", "")
+                before_fids = {
+                    item.get("fid", "")
+                    for item in before_dir.get("data", {}).get("list", [])
+                }
+                before_ok = True
         except Exception:
             pass
 
@@ -419,11 +608,7 @@ class Cloud115Adapter(BaseCloudDriveAdapter):
                 "data": {},
             }
         # 注入用户 cookie（转存需要登录态）
-        for kv in self.cookie.split(";"):
-            kv = kv.strip()
-            if "=" in kv:
-                k, v = kv.split("=", 1)
-                save_session.cookies.set(k.strip(), v.strip())
+        save_session.cookies.update(self._cookie_dict)
 
         # --- 执行转存 ---
         url = f"{self.WEB_URL}/webapi/share/receive"
@@ -446,43 +631,57 @@ class Cloud115Adapter(BaseCloudDriveAdapter):
 
         if errors:
             return {"code": 1, "message": "; ".join(errors), "data": {}}
-
-        # --- 转存后列目录，按文件名建立新 fid 映射 ---
-        time.sleep(3)  # 等待115后端同步
-        name_to_new_fid = {}  # {file_name: new_fid}
-        try:
-            after_dir = self.ls_dir(to_pdir_fid if to_pdir_fid else "0")
-            if after_dir.get("code") == 0:
-                for item in after_dir.get("data", {}).get("list", []):
-                    fid = item.get("fid", "")
-                    fname = item.get("file_name", "")
-                    # 只记录新增的文件（不在转存前的 fid 列表中）
-                    if fid and fid not in before_items:
-                        name_to_new_fid[fname] = fid
-        except Exception as e:
-            logging.error(f"[115] 转存后获取目录失败: {e}")
+        self._invalidate_ls_cache(to_pdir_fid)
+
+        # --- 转存后轮询列目录，按文件名建立新 fid 映射 ---
+        # 115后端同步有延迟：新文件全部出现或超时后停止轮询
+        # 以新增 fid 的数量判断是否到齐（同名文件在按名映射中会被合并，不能用于计数）；
+        # 转存前快照失败时改为等待 file_names 全部出现，未提供文件名则轮询至超时
+        new_items = []
+        deadline = time.monotonic() + self.SAVE_POLL_TIMEOUT
+        while True:
+            time.sleep(self.SAVE_POLL_INTERVAL)
+            try:
+                after_dir = self.ls_dir(to_pdir_fid if to_pdir_fid else "0")
+                if after_dir.get("code") == 0:
+                    # 只记录新增的文件（不在转存前的 fid 集合中）
+                    new_items = [
+                        item
+                        for item in after_dir.get("data", {}).get("list", [])
+                        if item.get("fid") and item.get("fid") not in before_fids
+                    ]
+            except Exception as e:
+                logging.error(f"[115] 转存后获取目录失败: {e}")
+            if before_ok:
+                arrived = len({item["fid"] for item in new_items}) >= len(fid_token_list)
+            else:
+                arrived = bool(file_names) and set(file_names) <= {
+                    item.get("file_name", "") for item in new_items
+                }
+            if arrived or time.monotonic() >= deadline:
+                break
+        name_to_new_fid = {
+            item.get("file_name", ""): item.get("fid", "") for item in new_items
+        }  # {file_name: new_fid}
 
         # --- 按 file_names 顺序组装 save_as_top_fids ---
         saved_fids = []
         if file_names:
+            # 去除特殊字符后的文件名索引（用于模糊匹配），同名时保留首个
+            cleaned_index = {}
+            for k, v in name_to_new_fid.items():
+                cleaned_index.setdefault(_RE_FNAME_CLEAN.sub('', k), v)
             for fname in file_names:
                 new_fid = name_to_new_fid.get(fname, "")
+                if not new_fid:
+                    # 如果按文件名找不到，可能是文件名有特殊字符被改变
+                    # 尝试模糊匹配（去除特殊字符后比较）
+                    new_fid = cleaned_index.get(_RE_FNAME_CLEAN.sub('', fname), "")
                 if new_fid:
                     saved_fids.append(new_fid)
                 else:
-                    # 如果按文件名找不到，可能是文件名有特殊字符被改变
-                    # 尝试模糊匹配（去除特殊字符后比较）
-                    fname_clean = re.sub(r'[^\w\s\.]', '', fname)
-                    found = False
-                    for k, v in name_to_new_fid.items():
-                        k_clean = re.sub(r'[^\w\s\.]', '', k)
-                        if fname_clean == k_clean:
-                            saved_fids.append(v)
-                            found = True
-                            break
-                    if not found:
-                        logging.warning(f"[115] 未找到文件 '{fname}' 的新 fid")
-                        saved_fids.append("")  # 占位，保持索引对齐
+                    logging.warning(f"[115] 未找到文件 '{fname}' 的新 fid")
+                    saved_fids.append("")  # 占位，保持索引对齐
         else:
             # 兼容旧调用方式：直接返回新增文件的 fid 列表
             saved_fids = list(name_to_new_fid.values())
@@ -534,6 +733,7 @@ class Cloud115Adapter(BaseCloudDriveAdapter):
                 f"{self.API_URL}/files/add", data=data, timeout=15
             )
             result = self._safe_json(resp)
+            self._invalidate_ls_cache(parent_cid)
             if result.get("state"):
                 return {
                     "code": 0,
@@ -557,12 +757,14 @@ class Cloud115Adapter(BaseCloudDriveAdapter):
 
     def rename(self, fid: str, file_name: str) -> Dict:
         """重命名文件"""
-        data = {f"files_new_name[{fid}]": file_name}
+        data = [(f"files_new_name[{fid}]", file_name)]
         try:
             resp = self.auth_session.post(
                 f"{self.API_URL}/files/batch_rename", data=data, timeout=15
             )
             result = self._safe_json(resp)
+            # 不知道所在目录，清空全部缓存
+            self._invalidate_ls_cache()
             if result.get("state"):
                 return {"code": 0, "message": "success"}
             return {"code": 1, "message": result.get("error", "重命名失败")}
@@ -571,14 +773,16 @@ class Cloud115Adapter(BaseCloudDriveAdapter):
 
     def delete(self, filelist: List[str]) -> Dict:
         """删除文件"""
-        data = {"pid": "0"}
-        for i, fid in enumerate(filelist):
-            data[f"fid[{i}]"] = fid
+        # requests 直接接受 (key, value) 列表作为表单
+        data = [("pid", "0")]
+        data.extend((f"fid[{i}]", fid) for i, fid in enumerate(filelist))
         try:
             resp = self.auth_session.post(
                 f"{self.API_URL}/rb/delete", data=data, timeout=15
             )
             result = self._safe_json(resp)
+            # 不知道所在目录，清空全部缓存
+            self._invalidate_ls_cache()
             if result.get("state"):
                 return {
                     "code": 0,
@@ -608,15 +812,15 @@ class Cloud115Adapter(BaseCloudDriveAdapter):
             for part in parts:
                 if not part:
                     continue
-                dir_list = self.ls_dir(current_cid)
-                if dir_list.get("code") != 0:
+                name_map = self._ls_dir_by_name(current_cid)
+                if name_map is None:
                     found = False
                     break
-                target = None
-                for item in dir_list.get("data", {}).get("list", []):
-                    if item.get("file_name") == part:
-                        target = item
-                        break
+                target = name_map.get(part)
+                if not target:
+                    # 未命中不信任缓存：目录可能刚由其他进程（如任务子进程）创建，重新列目录确认
+                    name_map = self._ls_dir_by_name(current_cid, no_cache=True)
+                    target = name_map.get(part) if name_map else None
                 if target:
                     current_cid = target.get("fid", "0")
                 else:
@@ -631,24 +835,24 @@ class Cloud115Adapter(BaseCloudDriveAdapter):
         解析 115 分享链接。
         支持域名: 115.com, 115cdn.com, anxia.com
         """
-        match_code = re.search(r"(?:115|anxia|115cdn)\.com/s/([^?#\s&]+)", url)
+        match_code = _RE_SHARE_CODE.search(url)
         share_code = match_code.group(1) if match_code else None
         pdir_fid = 0
 
         # 提取密码
         passcode = ""
-        match_pwd = re.search(r"password=([^&#\s]+)", url)
+        match_pwd = _RE_PWD.search(url)
         if match_pwd:
             passcode = match_pwd.group(1)
         else:
-            match_hash = re.search(r"#([^&#\s/]+)", url)
+            match_hash = _RE_HASH.search(url)
             if match_hash:
                 passcode = match_hash.group(1)
 
         # 提取子目录 ID（去除可能的尾部参数）
         if "#/list/share/" in url:
             raw_fid = url.split("#/list/share/")[-1]
-            match_fid = re.match(r"(\w+)", raw_fid)
+            match_fid = _RE_FID.match(raw_fid)
             if match_fid:
                 pdir_fid = match_fid.group(1)
 
@@ -665,18 +869,17 @@ class Cloud115Adapter(BaseCloudDriveAdapter):
           - 文件夹: cid=自身ID, n=名称, fc=内含文件数, 无 fid 字段
           - 文件:   fid=自身ID, cid=父文件夹ID, n=名称, s=大小, ico=类型
         """
-        is_dir = "fid" not in item
-        if is_dir:
-            own_id = str(item.get("cid", ""))
-        else:
-            own_id = str(item.get("fid", ""))
+        fid = item.get("fid")
+        is_dir = fid is None
+        own_id = str(item.get("cid", "") if is_dir else fid)
+        t = item.get("t", 0)
         return {
             "fid": own_id,
             "file_name": item.get("n", ""),
             "file_type": 0 if is_dir else 1,
-            "dir": bool(is_dir),
+            "dir": is_dir,
             "size": item.get("s", 0),
-            "updated_at": int(item.get("t", 0))*1000,
+            "updated_at": int(t) * 1000 if t else 0,
             "share_fid_token": own_id,
             "obj_category": self._get_category(item.get("ico", "")),
         }
@@ -688,18 +891,22 @@ class Cloud115Adapter(BaseCloudDriveAdapter):
           - 文件夹: cid=自身ID, n=名称, fc=内含文件数, 无 fid 字段
           - 文件:   fid=自身ID, cid=父文件夹ID, n=名称, s=大小, ico=类型
         """
-        is_dir = "fid" not in item
-        if is_dir:
-            own_id = str(item.get("cid", ""))
+        fid = item.get("fid")
+        is_dir = fid is None
+        own_id = str(item.get("cid", "") if is_dir else fid)
+        # t 可能是时间戳（数字或数字字符串），也可能是 "YYYY-MM-DD HH:MM" 格式字符串
+        t = item.get("t", 0)
+        if isinstance(t, str) and "-" in t:
+            updated_at = t
         else:
-            own_id = str(item.get("fid", ""))
+            updated_at = int(t) * 1000 if t else 0
         return {
             "fid": own_id,
             "file_name": item.get("n", ""),
             "file_type": 0 if is_dir else 1,
-            "dir": bool(is_dir),
+            "dir": is_dir,
             "size": int(item.get("s", 0)),
-            "updated_at": item.get("t", 0) if '-' in item.get("t", 0) else int(item.get("t", 0))*1000 ,
+            "updated_at": updated_at,
             "obj_category": self._get_category(item.get("ico", "")),
         }
 
@@ -708,15 +915,4 @@ class Cloud115Adapter(BaseCloudDriveAdapter):
         """根据图标类型判断文件类别"""
         if not ico:
             return ""
-        ico = ico.lower()
-        categories = {
-            "video": {"mp4", "mkv", "avi", "mov", "wmv", "flv", "rmvb", "ts"},
-            "audio": {"mp3", "wav", "flac", "aac", "ogg"},
-            "image": {"jpg", "jpeg", "png", "gif", "bmp", "webp"},
-            "doc": {"doc", "docx", "pdf", "txt", "xls", "xlsx", "ppt", "pptx"},
-            "archive": {"zip", "rar", "7z", "tar", "gz"},
-        }
-        for cat, exts in categories.items():
-            if ico in exts:
-                return cat
-        return ""
+        return _EXT_CATEGORY.get(ico.lower(), "")
@@ -7,12 +7,35 @@ import re
 import time
 import random
 import logging
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import unquote_to_bytes
 from typing import Dict, List, Tuple, Optional, Any
-from datetime import datetime
+from cachetools import TTLCache
 
 from adapters.base_adapter import BaseCloudDriveAdapter
 
+# orjson 直接解析/序列化 bytes，速度明显快于标准库；未安装时回退到 json
+try:
+    from orjson import loads as json_loads, dumps as json_dumps
+except ImportError:
+    import json
+
+    json_loads = json.loads
+
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+# 分享链接解析
+_RE_PWD_ID = re.compile(r"/s/(\w+)")
+_RE_PASSCODE = re.compile(r"(?:pwd|password)=(\w+)")
+_RE_PATH = re.compile(r"/(\w{32})-?([^/]+)?")
+# 容量不足错误：只匹配 message 字段，避免文件名、任务标题中出现该词被误判
+# （在响应原始 bytes 上忽略大小写匹配，未命中时无需解析 JSON）
+_RE_CAPACITY = re.compile(rb'"message"\s*:\s*"[^"]*capacity limit', re.IGNORECASE)
+
 
 class UCAdapter(BaseCloudDriveAdapter):
     """UC网盘适配器"""
@@ -28,11 +51,33 @@ class UCAdapter(BaseCloudDriveAdapter):
         "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
     )
 
+    # 列表分页大小与并发拉取分页的线程数
+    PAGE_SIZE = 50
+    PAGE_MAX_WORKERS = 8
+    # 账户信息缓存时长（秒）
+    ACCOUNT_CACHE_TTL = 300
+    # 目录列表缓存时长（秒）
+    LS_CACHE_TTL = 30
+    # 连接级瞬时错误的最大请求次数
+    REQUEST_RETRIES = 3
+
+    # 所有实例共享的连接池：多账户之间复用 TCP/TLS 连接
+    # （各实例仍使用独立 session，cookie jar 互不干扰）
+    _SHARED_HTTP_ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=50)
+
     def __init__(self, cookie: str = "", index: int = 0):
         super().__init__(cookie, index)
         self._cookies_dict: Dict[str, str] = {}
         
         self._share_folder_fid: Optional[str] = None
+
+        # 账户信息缓存
+        self._account_cache: Optional[Dict] = None
+        self._account_cache_ts: float = 0
+
+        # 目录列表缓存：同一目录短时间内重复列出（转存→校验→重命名）时直接复用
+        self._ls_cache: TTLCache = TTLCache(maxsize=256, ttl=self.LS_CACHE_TTL)
+        self._ls_cache_lock = threading.Lock()
         
         # 解析 cookie
         if cookie:
@@ -42,37 +87,137 @@ class UCAdapter(BaseCloudDriveAdapter):
                     k, v = item.split("=", 1)
                     self._cookies_dict[k.strip()] = v.strip()
 
-    def _send_request(self, method: str, url: str, **kwargs) -> requests.Response:
-        """发送 HTTP 请求"""
-        headers = {
-            "cookie": self.cookie,
+        # 持久 session：复用 keep-alive 连接，避免每次请求重新 TCP+TLS 握手
+        # cookie 交给 session 的 cookie jar 管理，不再作为固定请求头发送
+        self._session = requests.Session()
+        self._session.cookies.update(self._cookies_dict)
+        self._session.headers.update({
             "content-type": "application/json",
             "user-agent": self.USER_AGENT,
             "origin": self.BASE_URL_DRIVE,
             "referer": f"{self.BASE_URL_DRIVE}/",
-        }
-        if "headers" in kwargs:
-            headers.update(kwargs["headers"])
-            del kwargs["headers"]
+        })
+        # 所有接口都携带的固定查询参数
+        self._session.params = {"pr": "UCBrowser", "fr": "pc"}
+        self._session.mount("https://", self._SHARED_HTTP_ADAPTER)
 
-        try:
-            response = requests.request(method, url, headers=headers, timeout=30, **kwargs)
-            return response
-        except Exception as e:
-            logging.error(f"[UC] 请求失败: {e}")
-            fake_response = requests.Response()
-            fake_response.status_code = 500
-            fake_response._content = b'{"status": 500, "code": 1, "message": "request error"}'
-            return fake_response
+    def _send_request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        发送 HTTP 请求。
+        静态请求头与固定查询参数已设置在 session 上，kwargs 中的 headers/params 仅作补充或覆盖。
+        """
+        # JSON 请求体预先序列化为 bytes，content-type 已由 session 统一设置
+        if "json" in kwargs:
+            kwargs["data"] = json_dumps(kwargs.pop("json"))
+
+        # 连接级瞬时错误原地重试。GET 可安全重发；其余方法只在连接未建立时重试，
+        # 避免服务端已处理（如转存）的请求被重复提交
+        if method.upper() == "GET":
+            retry_on = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+        else:
+            retry_on = (requests.exceptions.ConnectTimeout,)
+
+        for attempt in range(self.REQUEST_RETRIES):
+            try:
+                return self._session.request(method, url, timeout=30, **kwargs)
+            except retry_on as e:
+                if attempt + 1 >= self.REQUEST_RETRIES:
+                    logging.error(f"[UC] 请求失败: {e}")
+                    break
+                logging.debug(f"[UC] 请求异常，第 {attempt + 1} 次重试: {e}")
+                time.sleep(0.2 * (2 ** attempt) + random.random() * 0.1)
+            except Exception as e:
+                logging.error(f"[UC] 请求失败: {e}")
+                break
+
+        fake_response = requests.Response()
+        fake_response.status_code = 500
+        fake_response._content = b'{"status": 500, "code": 1, "message": "request error"}'
+        return fake_response
 
     def _safe_json(self, response: requests.Response) -> Dict:
         """安全解析 JSON 响应"""
         try:
-            return response.json()
+            return json_loads(response.content)
         except Exception as e:
             logging.warning(f"[UC] JSON解析失败: {e}")
             return {"code": 1, "status": 500, "message": "响应解析失败"}
 
+    @staticmethod
+    def _is_capacity_error(result: Dict) -> bool:
+        """解析后的响应是否为容量不足错误（以 message 字段为准）"""
+        message = result.get("message") if isinstance(result, dict) else None
+        return isinstance(message, str) and "capacity limit" in message.lower()
+
+    def _get_json(self, url: str, params: Dict) -> Dict:
+        """
+        流式 GET 并解析 JSON：直接读取底层 urllib3 响应体，
+        跳过 requests 对 response.content 的缓冲拷贝（用于分页列表等较大响应）
+        """
+        response = self._send_request("GET", url, params=params, stream=True)
+        if response.raw is None:
+            # _send_request 构造的失败响应没有底层连接
+            return self._safe_json(response)
+        with response:
+            try:
+                return json_loads(response.raw.read(decode_content=True))
+            except Exception as e:
+                logging.warning(f"[UC] JSON解析失败: {e}")
+                return {"code": 1, "status": 500, "message": "响应解析失败"}
+
+    def _fetch_pages(
+        self, url: str, params: Dict, max_items: int = 0
+    ) -> Tuple[Dict, List]:
+        """
+        拉取分页列表：首页同步请求以获取 _total，其余分页并发请求并按页序合并。
+        Args:
+            url: 列表接口地址
+            params: 除 _page 外的请求参数
+            max_items: 最大条目数，0 表示不限制（只请求覆盖该数量所需的分页）
+        Returns:
+            (首页响应, 合并后的文件列表)；任一页失败时返回 (失败响应, [])
+        """
+        def fetch(page: int) -> Dict:
+            return self._get_json(url, {**params, "_page": page})
+
+        def fetch_list(page: int) -> Tuple[Optional[List], Dict]:
+            # 后续分页只保留 data.list，其余字段在工作线程内即释放
+            result = fetch(page)
+            if result.get("code") != 0:
+                return None, result
+            return result.get("data", {}).get("list", []), {}
+
+        first = fetch(1)
+        if first.get("code") != 0:
+            return first, []
+        # 直接在首页列表上追加，省去一次拷贝
+        list_merge = first.get("data", {}).get("list") or []
+
+        # 首页不满一页即为最后一页，无需再看 _total
+        if len(list_merge) < self.PAGE_SIZE:
+            return first, list_merge
+
+        total = first.get("metadata", {}).get("_total", 0)
+        if max_items > 0:
+            total = min(total, max_items)
+        page_count = -(-total // self.PAGE_SIZE)
+        if page_count > 1:
+            with ThreadPoolExecutor(max_workers=self.PAGE_MAX_WORKERS) as executor:
+                # 一次性提交 2..page_count 页，按页序合并
+                futures = [
+                    executor.submit(fetch_list, page)
+                    for page in range(2, page_count + 1)
+                ]
+                for future in futures:
+                    page_list, error = future.result()
+                    if page_list is None:
+                        # 任一页失败即放弃，取消尚未开始的分页请求
+                        for pending in futures:
+                            pending.cancel()
+                        return error, []
+                    list_merge.extend(page_list)
+        return first, list_merge
+
     def init(self) -> Any:
         """初始化账户"""
         account_info = self.get_account_info()
@@ -83,15 +228,22 @@ class UCAdapter(BaseCloudDriveAdapter):
         return False
 
     def get_account_info(self) -> Any:
-        """获取账户信息"""
+        """获取账户信息（成功结果缓存 ACCOUNT_CACHE_TTL 秒）"""
+        if (
+            self._account_cache
+            and time.monotonic() - self._account_cache_ts < self.ACCOUNT_CACHE_TTL
+        ):
+            return self._account_cache
+
         # UC 网盘账户信息 API
         url = f"{self.BASE_URL_DRIVE}/account/info"
-        params = {"pr": "UCBrowser", "fr": "pc"}
         
         try:
-            response = self._send_request("GET", url, params=params)
+            response = self._send_request("GET", url)
             data = self._safe_json(response)
             if data.get("data"):
+                self._account_cache = data["data"]
+                self._account_cache_ts = time.monotonic()
                 return data["data"]
         except Exception as e:
             logging.error(f"[UC] 获取账户信息失败: {e}")
@@ -101,11 +253,10 @@ class UCAdapter(BaseCloudDriveAdapter):
     def get_stoken(self, pwd_id: str, passcode: str = "") -> Dict:
         """获取分享令牌"""
         url = f"{self.BASE_URL}/1/clouddrive/share/sharepage/token"
-        params = {"pr": "UCBrowser", "fr": "pc"}
         payload = {"pwd_id": pwd_id, "passcode": passcode}
 
         try:
-            response = self._send_request("POST", url, json=payload, params=params)
+            response = self._send_request("POST", url, json=payload)
             result = self._safe_json(response)
             return result
         except Exception as e:
@@ -121,49 +272,27 @@ class UCAdapter(BaseCloudDriveAdapter):
         fetch_share_full_path: int = 0,
     ) -> Dict:
         """获取分享文件详情"""
-        list_merge = []
-        page = 1
-        result = {}
-
-        while True:
-            url = f"{self.BASE_URL}/1/clouddrive/share/sharepage/detail"
-            params = {
-                "pr": "UCBrowser",
-                "fr": "pc",
-                "pwd_id": pwd_id,
-                "stoken": stoken,
-                "pdir_fid": pdir_fid,
-                "force": "0",
-                "_page": page,
-                "_size": "50",
-                "_fetch_banner": "0",
-                "_fetch_share": _fetch_share,
-                "_fetch_total": "1",
-                "_sort": "file_type:asc,updated_at:desc",
-                "fetch_share_full_path": fetch_share_full_path,
-            }
+        url = f"{self.BASE_URL}/1/clouddrive/share/sharepage/detail"
+        params = {
+            "pwd_id": pwd_id,
+            "stoken": stoken,
+            "pdir_fid": pdir_fid,
+            "force": "0",
+            "_size": str(self.PAGE_SIZE),
+            "_fetch_banner": "0",
+            "_fetch_share": _fetch_share,
+            "_fetch_total": "1",
+            "_sort": "file_type:asc,updated_at:desc",
+            "fetch_share_full_path": fetch_share_full_path,
+        }
 
-            try:
-                response = self._send_request("GET", url, params=params)
-                result = self._safe_json(response)
-                
-                if result.get("code") != 0:
-                    return result
-                
-                file_list = result.get("data", {}).get("list", [])
-                if file_list:
-                    list_merge.extend(file_list)
-                    page += 1
-                else:
-                    break
-                
-                total = result.get("metadata", {}).get("_total", 0)
-                if len(list_merge) >= total:
-                    break
-                    
-            except Exception as e:
-                logging.error(f"[UC] 获取分享详情失败: {e}")
-                return {"code": 1, "message": f"获取分享详情失败: {e}", "data": {"list": []}}
+        try:
+            result, list_merge = self._fetch_pages(url, params)
+            if result.get("code") != 0:
+                return result
+        except Exception as e:
+            logging.error(f"[UC] 获取分享详情失败: {e}")
+            return {"code": 1, "message": f"获取分享详情失败: {e}", "data": {"list": []}}
 
         # 保留完整的API响应（包含full_path等字段），仅替换合并后的文件列表
         if result.get("data"):
@@ -172,59 +301,72 @@ class UCAdapter(BaseCloudDriveAdapter):
             result["data"] = {"list": list_merge}
         return result
 
-    def ls_dir(self, pdir_fid: str, max_items: int = 0, **kwargs) -> Dict:
-        """列出目录内容"""
-        list_merge = []
-        page = 1
+    def ls_dir(self, pdir_fid: str, max_items: int = 0, no_cache: bool = False, **kwargs) -> Dict:
+        """
+        列出目录内容
+        Args:
+            pdir_fid: 目录 ID
+            max_items: 最多返回条数，0 为不限
+            no_cache: 为 True 时跳过缓存直接请求
+        """
+        fetch_full_path = kwargs.get("fetch_full_path", 0)
+        key = (str(pdir_fid), fetch_full_path, max_items)
+        if not no_cache:
+            with self._ls_cache_lock:
+                cached = self._ls_cache.get(key)
+            if cached is not None:
+                return self._ls_result(cached)
+
+        url = f"{self.BASE_URL}/1/clouddrive/file/sort"
+        params = {
+            "pdir_fid": pdir_fid,
+            "_size": str(self.PAGE_SIZE),
+            "_fetch_total": "1",
+            "_fetch_sub_dirs": "0",
+            "_sort": "file_type:asc,updated_at:desc",
+            "_fetch_full_path": fetch_full_path,
+        }
 
-        while True:
-            url = f"{self.BASE_URL}/1/clouddrive/file/sort"
-            params = {
-                "pr": "UCBrowser",
-                "fr": "pc",
-                "pdir_fid": pdir_fid,
-                "_page": page,
-                "_size": "50",
-                "_fetch_total": "1",
-                "_fetch_sub_dirs": "0",
-                "_sort": "file_type:asc,updated_at:desc",
-                "_fetch_full_path": kwargs.get("fetch_full_path", 0),
-            }
+        try:
+            result, list_merge = self._fetch_pages(url, params, max_items)
+            if result.get("code") != 0:
+                return result
+        except Exception as e:
+            logging.error(f"[UC] 列出目录失败: {e}")
+            return {"code": 1, "message": f"列出目录失败: {e}", "data": {"list": []}}
 
-            try:
-                response = self._send_request("GET", url, params=params)
-                result = self._safe_json(response)
-                
-                if result.get("code") != 0:
-                    return result
-                
-                file_list = result.get("data", {}).get("list", [])
-                if file_list:
-                    list_merge.extend(file_list)
-                    page += 1
-                else:
-                    break
-                
-                # max_items 限量：达到上限后提前终止分页
-                if max_items > 0 and len(list_merge) >= max_items:
-                    list_merge = list_merge[:max_items]
-                    break
+        # max_items 限量
+        if max_items > 0 and len(list_merge) > max_items:
+            list_merge = list_merge[:max_items]
 
-                total = result.get("metadata", {}).get("_total", 0)
-                if len(list_merge) >= total:
-                    break
-                    
-            except Exception as e:
-                logging.error(f"[UC] 列出目录失败: {e}")
-                return {"code": 1, "message": f"列出目录失败: {e}", "data": {"list": []}}
+        with self._ls_cache_lock:
+            self._ls_cache[key] = list_merge
+        return self._ls_result(list_merge)
 
+    @staticmethod
+    def _ls_result(file_list: List[Dict]) -> Dict:
+        """组装 ls_dir 返回结构（列表浅拷贝，调用方修改不影响缓存）"""
         return {
             "code": 0,
             "message": "success",
-            "data": {"list": list_merge},
-            "metadata": {"_total": len(list_merge)},
+            "data": {"list": list(file_list)},
+            "metadata": {"_total": len(file_list)},
         }
 
+    def _invalidate_ls_cache(self, pdir_fid: str = None):
+        """
+        失效 ls_dir 缓存。
+        Args:
+            pdir_fid: 指定目录，None 时清空全部
+        """
+        with self._ls_cache_lock:
+            if pdir_fid is None:
+                self._ls_cache.clear()
+                return
+            pdir_fid = str(pdir_fid)
+            for key in [k for k in self._ls_cache.keys() if k[0] == pdir_fid]:
+                self._ls_cache.pop(key, None)
+
     def save_file(
         self,
         fid_list: List[str],
@@ -237,10 +379,8 @@ class UCAdapter(BaseCloudDriveAdapter):
         url = f"{self.BASE_URL}/1/clouddrive/share/sharepage/save"
         params = {
             "entry": "update_share",
-            "pr": "UCBrowser",
-            "fr": "pc",
-            "__dt": int(random.uniform(1, 5) * 60 * 1000),
-            "__t": datetime.now().timestamp(),
+            "__dt": random.randint(60000, 300000),
+            "__t": time.time(),
         }
         payload = {
             "fid_list": fid_list,
@@ -252,13 +392,13 @@ class UCAdapter(BaseCloudDriveAdapter):
             "scene": "link",
         }
         logging.debug(f"[UC] 转存文件参数: {payload}")
+        self._invalidate_ls_cache(to_pdir_fid)
         try:
             response = self._send_request("POST", url, json=payload, params=params)
-            result = self._safe_json(response)
 
-            # 检查容量限制错误
-            msg = result.get("message", "")
-            if "capacity limit" in msg.lower():
+            result = self._safe_json(response)
+            # 检查容量限制错误（先在原始 bytes 上预筛，再以解析后的 message 确认）
+            if _RE_CAPACITY.search(response.content) and self._is_capacity_error(result):
                 logging.error("[UC] 网盘容量不足，无法转存")
                 return {"code": 1, "status": 400, "message": "UC网盘容量不足，请清理空间后重试", "data": {}}
             logging.debug(f"[UC] 转存结果: {result}")
@@ -270,37 +410,41 @@ class UCAdapter(BaseCloudDriveAdapter):
     def query_task(self, task_id: str) -> Dict:
         """查询任务状态"""
         retry_index = 0
-        max_retries = 60
+        # 指数退避（0.2s 起，封顶 3s），16 次约覆盖原 60×0.5s 的 30 秒等待
+        max_retries = 16
         result = {"status": 500, "code": 1, "message": "任务查询超时"}
+        last_body = b""
         logging.debug(f"[UC] 查询任务: {task_id}")
         while retry_index < max_retries:
             url = f"{self.BASE_URL}/1/clouddrive/task"
             params = {
-                "pr": "UCBrowser",
-                "fr": "pc",
                 "task_id": task_id,
                 "retry_index": retry_index,
-                "__dt": int(random.uniform(1, 5) * 60 * 1000),
-                "__t": datetime.now().timestamp(),
+                "__dt": random.randint(60000, 300000),
+                "__t": time.time(),
             }
 
             try:
                 response = self._send_request("GET", url, params=params)
-                result = self._safe_json(response)
 
-                # 检查容量限制错误
-                msg = result.get("message", "")
-                if "capacity limit" in msg.lower():
-                    logging.error("[UC] 网盘容量不足")
-                    return {"status": 400, "code": 1, "message": "UC网盘容量不足，请清理空间后重试", "data": {"status": -1}}
+                # 响应与上一轮完全相同时沿用上次的解析结果（任务仍在进行中）
+                body = response.content
+                if body != last_body:
+                    result = self._safe_json(response)
+                    # 检查容量限制错误（先在原始 bytes 上预筛，再以解析后的 message 确认）
+                    if _RE_CAPACITY.search(body) and self._is_capacity_error(result):
+                        logging.error("[UC] 网盘容量不足")
+                        return {"status": 400, "code": 1, "message": "UC网盘容量不足，请清理空间后重试", "data": {"status": -1}}
+                    last_body = body
 
                 if result.get("status") != 200:
                     return result
 
                 task_status = result.get("data", {}).get("status")
 
-                # 任务完成
+                # 任务完成：转存/移动等异步任务已改变目录内容
                 if task_status == 2:
+                    self._invalidate_ls_cache()
                     if retry_index > 0:
                         logging.info("")
                     break
@@ -316,8 +460,8 @@ class UCAdapter(BaseCloudDriveAdapter):
                     task_title = result.get("data", {}).get("task_title", "任务")
                     logging.info(f"[UC] 等待任务[{task_title}]执行结果...")
 
+                time.sleep(min(0.2 * (1.5 ** retry_index) + random.random() * 0.1, 3.0))
                 retry_index += 1
-                time.sleep(0.5)
 
             except Exception as e:
                 logging.error(f"[UC] 查询任务失败: {e}")
@@ -328,7 +472,6 @@ class UCAdapter(BaseCloudDriveAdapter):
     def mkdir(self, dir_path: str) -> Dict:
         """创建目录"""
         url = f"{self.BASE_URL}/1/clouddrive/file"
-        params = {"pr": "UCBrowser", "fr": "pc"}
         payload = {
             "pdir_fid": "0",
             "file_name": "",
@@ -336,8 +479,9 @@ class UCAdapter(BaseCloudDriveAdapter):
             "dir_init_lock": False,
         }
 
+        self._invalidate_ls_cache()
         try:
-            response = self._send_request("POST", url, json=payload, params=params)
+            response = self._send_request("POST", url, json=payload)
             result = self._safe_json(response)
             return result
         except Exception as e:
@@ -347,11 +491,11 @@ class UCAdapter(BaseCloudDriveAdapter):
     def rename(self, fid: str, file_name: str) -> Dict:
         """重命名文件"""
         url = f"{self.BASE_URL}/1/clouddrive/file/rename"
-        params = {"pr": "UCBrowser", "fr": "pc"}
         payload = {"fid": fid, "file_name": file_name}
 
+        self._invalidate_ls_cache()
         try:
-            response = self._send_request("POST", url, json=payload, params=params)
+            response = self._send_request("POST", url, json=payload)
             result = self._safe_json(response)
             return result
         except Exception as e:
@@ -361,11 +505,11 @@ class UCAdapter(BaseCloudDriveAdapter):
     def delete(self, filelist: List[str]) -> Dict:
         """删除文件"""
         url = f"{self.BASE_URL}/1/clouddrive/file/delete"
-        params = {"pr": "UCBrowser", "fr": "pc"}
         payload = {"action_type": 2, "filelist": filelist, "exclude_fids": []}
 
+        self._invalidate_ls_cache()
         try:
-            response = self._send_request("POST", url, json=payload, params=params)
+            response = self._send_request("POST", url, json=payload)
             result = self._safe_json(response)
             return result
         except Exception as e:
@@ -375,7 +519,6 @@ class UCAdapter(BaseCloudDriveAdapter):
     def move_file(self, filelist: List[str], to_pdir_fid: str) -> Dict:
         """移动文件到指定目录"""
         url = f"{self.BASE_URL}/1/clouddrive/file/move"
-        params = {"pr": "UCBrowser", "fr": "pc"}
         payload = {
             "action_type": 1,
             "to_pdir_fid": to_pdir_fid,
@@ -383,8 +526,9 @@ class UCAdapter(BaseCloudDriveAdapter):
             "exclude_fids": [],
         }
         logging.debug(f"[UC] 移动文件: {filelist} -> {to_pdir_fid}")
+        self._invalidate_ls_cache()
         try:
-            response = self._send_request("POST", url, json=payload, params=params)
+            response = self._send_request("POST", url, json=payload)
             result = self._safe_json(response)
             logging.debug(f"[UC] 移动文件结果: {result}")
             return result
@@ -432,50 +576,62 @@ class UCAdapter(BaseCloudDriveAdapter):
             return {"code": 0, "message": "无文件需要移动"}
 
         logging.debug(f"[UC] 移动 {len(fid_list)} 个文件到目标目录...")
-        remaining = fid_list[:]
-        while remaining:
-            batch = remaining[:100]
-            remaining = remaining[100:]
-
-            move_result = self.move_file(batch, to_pdir_fid)
-            if move_result.get("code") != 0:
-                return move_result
-
-            task_id = move_result.get("data", {}).get("task_id")
-            if task_id:
-                query_result = self.query_task(task_id)
-                if query_result.get("code") != 0 or query_result.get("data", {}).get("status") == -1:
-                    msg = query_result.get("data", {}).get("message", query_result.get("message", "移动任务失败"))
-                    return {"code": 1, "message": msg}
+        batches = [fid_list[i:i + 100] for i in range(0, len(fid_list), 100)]
+        # 各批次互不依赖：并发提交移动任务并各自轮询，按批次顺序返回首个失败
+        with ThreadPoolExecutor(max_workers=self.PAGE_MAX_WORKERS) as executor:
+            results = list(executor.map(
+                lambda batch: self._move_batch(batch, to_pdir_fid), batches
+            ))
+        for result in results:
+            if result.get("code") != 0:
+                return result
 
         return {"code": 0, "message": "移动完成"}
 
+    def _move_batch(self, batch: List[str], to_pdir_fid: str) -> Dict:
+        """移动一批文件并等待任务完成"""
+        move_result = self.move_file(batch, to_pdir_fid)
+        if move_result.get("code") != 0:
+            return move_result
+
+        task_id = move_result.get("data", {}).get("task_id")
+        if task_id:
+            query_result = self.query_task(task_id)
+            if query_result.get("code") != 0 or query_result.get("data", {}).get("status") == -1:
+                msg = query_result.get("data", {}).get("message", query_result.get("message", "移动任务失败"))
+                return {"code": 1, "message": msg}
+        return {"code": 0, "message": "success"}
+
     def get_fids(self, file_paths: List[str]) -> List[Dict]:
-        """根据路径获取文件 ID"""
-        fids = []
-        
-        while file_paths:
-            url = f"{self.BASE_URL}/1/clouddrive/file/info/path_list"
-            params = {"pr": "UCBrowser", "fr": "pc"}
-            payload = {"file_path": file_paths[:50], "namespace": "0"}
+        """根据路径获取文件 ID（每批 50 个路径，多批并发请求）"""
+        chunks = [file_paths[i:i + 50] for i in range(0, len(file_paths), 50)]
+        if not chunks:
+            return []
 
-            try:
-                response = self._send_request("POST", url, json=payload, params=params)
-                result = self._safe_json(response)
-                
-                if result.get("code") == 0:
-                    fids.extend(result.get("data", []))
-                    file_paths = file_paths[50:]
-                else:
-                    logging.error(f"[UC] 获取目录ID失败: {result.get('message')}")
+        fids = []
+        with ThreadPoolExecutor(max_workers=self.PAGE_MAX_WORKERS) as executor:
+            # 按批次顺序合并，遇到失败批次即停止（与逐批请求时行为一致）
+            for chunk_fids in executor.map(self._fetch_fid_chunk, chunks):
+                if chunk_fids is None:
                     break
-                    
-            except Exception as e:
-                logging.error(f"[UC] 获取目录ID失败: {e}")
-                break
-
+                fids.extend(chunk_fids)
         return fids
 
+    def _fetch_fid_chunk(self, file_paths: List[str]) -> Optional[List[Dict]]:
+        """请求一批路径的文件 ID，失败返回 None"""
+        url = f"{self.BASE_URL}/1/clouddrive/file/info/path_list"
+        payload = {"file_path": file_paths, "namespace": "0"}
+
+        try:
+            response = self._send_request("POST", url, json=payload)
+            result = self._safe_json(response)
+            if result.get("code") == 0:
+                return result.get("data", [])
+            logging.error(f"[UC] 获取目录ID失败: {result.get('message')}")
+        except Exception as e:
+            logging.error(f"[UC] 获取目录ID失败: {e}")
+        return None
+
     def extract_url(self, url: str) -> Tuple[Optional[str], str, Any, List]:
         """
         解析UC网盘分享链接
@@ -484,22 +640,24 @@ class UCAdapter(BaseCloudDriveAdapter):
         - https://drive.uc.cn/s/{share_id}
         - https://drive.uc.cn/s/{share_id}?password=xxxx
         """
-        import urllib.parse
-
         # pwd_id
-        match_id = re.search(r"/s/(\w+)", url)
+        match_id = _RE_PWD_ID.search(url)
         pwd_id = match_id.group(1) if match_id else None
         
         # passcode
-        match_pwd = re.search(r"(?:pwd|password)=(\w+)", url)
+        match_pwd = _RE_PASSCODE.search(url)
         passcode = match_pwd.group(1) if match_pwd else ""
         
         # path: fid-name
         paths = []
-        matches = re.findall(r"/(\w{32})-?([^/]+)?", url)
+        matches = _RE_PATH.findall(url)
         for match in matches:
             fid = match[0]
-            name = urllib.parse.unquote(match[1]).replace("*101", "-") if match[1] else ""
+            name = (
+                unquote_to_bytes(match[1]).decode("utf-8", "replace").replace("*101", "-")
+                if match[1]
+                else ""
+            )
             paths.append({"fid": fid, "name": name})
         
         pdir_fid = paths[-1]["fid"] if matches else 0
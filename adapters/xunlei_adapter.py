@@ -7,13 +7,27 @@
 import re
 import json
 import time
+import random
 import logging
 import hashlib
+import calendar
 import threading
-from typing import Dict, List, Tuple, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple, Optional, Any, Iterator, Callable
 from datetime import datetime
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from cachetools import TTLCache
+
+try:
+    from orjson import loads as json_loads, dumps as json_dumps
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
 
 from adapters.base_adapter import BaseCloudDriveAdapter
 
@@ -49,6 +63,47 @@ FILE_LIST_FILTERS = json.dumps({
     "trashed": {"eq": False},
 })
 
+# 文件列表接口的固定参数（调用处复制后再补充 parent_id / page_token）
+_LS_BASE_PARAMS = {
+    "filters": FILE_LIST_FILTERS,
+    "with_audit": "true",
+    "thumbnail_size": "SIZE_SMALL",
+    "limit": 100,
+}
+_FIND_BASE_PARAMS = {
+    "filters": FILE_LIST_FILTERS,
+    "limit": 100,
+}
+
+# 时间格式：2024-01-01T12:00:00.000+08:00 / 2024-01-01T04:00:00Z
+_RE_TIME = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?(Z|[+-]\d{2}:?\d{2})?"
+)
+
+
+def _parse_xunlei_time(time_str: str) -> int:
+    """将迅雷 ISO 8601 时间字符串解析为毫秒时间戳，无法识别时回退 datetime 解析"""
+    m = _RE_TIME.match(time_str)
+    if not m:
+        try:
+            return int(datetime.fromisoformat(time_str.replace("Z", "+00:00")).timestamp() * 1000)
+        except Exception:
+            return 0
+    y, mo, d, h, mi, se, frac, tz = m.groups()
+    ts = calendar.timegm((int(y), int(mo), int(d), int(h), int(mi), int(se), 0, 0, 0))
+    # 带时区偏移时换算为 UTC；无时区信息视为 UTC
+    if tz and tz != "Z":
+        offset = int(tz[1:3]) * 3600 + int(tz[-2:]) * 60
+        ts -= offset if tz[0] == "+" else -offset
+    ms = int(frac[:3].ljust(3, "0")) if frac else 0
+    return ts * 1000 + ms
+
+
+# 分享链接解析
+_RE_SHARE = re.compile(r"pan\.xunlei\.com/s/([a-zA-Z0-9_-]+)")
+_RE_PWD = re.compile(r"(?:pwd|password)=([a-zA-Z0-9]+)")
+_RE_FID = re.compile(r"(\w+)")
+
 # 错误码映射
 ERROR_CODES = {
     "ALREADY_EXISTED": "文件已存在",
@@ -62,14 +117,23 @@ ERROR_CODES = {
     "WRONG_PASS_CODE": "提取码错误",
 }
 
+def _debug_enabled() -> bool:
+    """DEBUG 级别是否启用（未启用时连同日志参数的计算一并跳过）"""
+    return logging.getLogger().isEnabledFor(logging.DEBUG)
+
+
 # 全局配置保存函数
 _global_config_saver = None
 
+# 是否启用后台提前刷新 Token（仅 WebUI 进程启用；任务子进程按需同步刷新，
+# 避免两个进程各自提前轮换同一个一次性 refresh_token）
+_background_refresh_enabled = False
+
 
 def _config_saver_factory(config_path: str):
     """创建配置保存函数"""
-    def save_config(new_refresh_token: str, account_name: str = None):
-        """保存新的 refresh_token 到配置文件"""
+    def save_config(new_refresh_token: str, account_name: str = None, adapter=None):
+        """保存新的 refresh_token 到配置文件（adapter 为发起刷新的实例，此处不使用）"""
         try:
             from quark_auto_save import Config
             config = Config.read_json(config_path)
@@ -87,7 +151,8 @@ def _config_saver_factory(config_path: str):
                     acc["cookie"] = new_refresh_token
                     acc["_token_updated_at"] = current_time
                     updated = True
-                    logging.debug(f"[Xunlei] 已更新账户 {acc.get('name', 'unknown')} 的 refresh_token (时间戳: {current_time})")
+                    if _debug_enabled():
+                        logging.debug("[Xunlei] 已更新账户 %s 的 refresh_token (时间戳: %s)", acc.get('name', 'unknown'), current_time)
                     if account_name:
                         break
 
@@ -99,16 +164,22 @@ def _config_saver_factory(config_path: str):
                 logging.warning("[Xunlei] 未找到需要更新的迅雷网盘账户")
                 return False
         except Exception as e:
-            logging.error(f"[Xunlei] 保存 refresh_token 失败: {e}")
+            logging.error("[Xunlei] 保存 refresh_token 失败: %s", e)
             return False
 
     return save_config
 
 
-def set_config_saver(config_path: str):
-    """设置配置保存函数"""
+def set_config_saver(config_path: str, saver: Optional[Callable] = None):
+    """设置配置保存函数；传入 saver 时直接使用（如 WebUI 需经自身的配置锁写盘）"""
     global _global_config_saver
-    _global_config_saver = _config_saver_factory(config_path)
+    _global_config_saver = saver or _config_saver_factory(config_path)
+
+
+def enable_background_refresh(enabled: bool = True):
+    """启用/停用后台 Token 提前刷新线程（应只在常驻的 WebUI 进程中启用）"""
+    global _background_refresh_enabled
+    _background_refresh_enabled = enabled
 
 
 class XunleiAdapter(BaseCloudDriveAdapter):
@@ -116,10 +187,43 @@ class XunleiAdapter(BaseCloudDriveAdapter):
 
     DRIVE_TYPE = "xunlei"
 
+    # 每次请求都会访问的实例属性使用 slot 描述符存取；
+    # 基类未声明 __slots__，cookie/index 等基类属性仍保存在 __dict__ 中
+    __slots__ = (
+        "_session", "_auth_session", "_refresh_token", "_account_name",
+        "_access_token", "_access_token_expire", "_captcha_token", "_captcha_token_expire",
+        "_min_expire", "_token_updated_at", "_device_id", "_user_id", "_user_name",
+        "_token_lock", "_dir_cache", "_dir_cache_lock",
+        "_last_used", "_refresh_stop", "_refresh_thread",
+    )
+
+    # 连接池大小（需不小于并发请求的线程数）
+    POOL_MAXSIZE = 32
+    # get_fids 并发解析路径的线程数
+    FIDS_MAX_WORKERS = 8
+    # 按名称查找时目录列表的缓存时长（秒）
+    DIR_CACHE_TTL = 5
+    # 后台线程提前刷新 Token 的时间（秒）
+    TOKEN_REFRESH_AHEAD = 60
+    # 超过该时长（秒）无请求时后台刷新线程退出，之后的请求回到同步刷新
+    TOKEN_IDLE_TIMEOUT = 600
+    # 任务轮询的总等待时长（秒）
+    TASK_POLL_TIMEOUT = 30
+
     def __init__(self, cookie: str = "", index: int = 0, account_name: str = ""):
         super().__init__(cookie, index)
         self._session: requests.Session = requests.Session()
         self._session.headers.update(XUNLEI_HEADERS)
+        self._mount_http_adapter(self._session)
+
+        # Token 刷新专用 session：access/captcha 两个刷新接口同在 xluser-ssl 域名下，
+        # 复用 keep-alive 连接；不携带 Authorization/captcha 等 API 请求头
+        self._auth_session: requests.Session = requests.Session()
+        self._auth_session.headers.update({
+            "Content-Type": "application/json",
+            "User-Agent": XUNLEI_UA,
+        })
+        self._mount_http_adapter(self._auth_session)
 
         # refresh_token 存储在 cookie 字段中
         self._refresh_token: str = cookie.strip() if cookie else ""
@@ -127,11 +231,13 @@ class XunleiAdapter(BaseCloudDriveAdapter):
         # 账户名称（用于多账户配置保存）
         self._account_name: str = account_name
 
-        # 双 Token
+        # 双 Token（过期时间基于 time.monotonic()，不受系统时间调整影响）
         self._access_token: str = ""
         self._access_token_expire: float = 0
         self._captcha_token: str = ""
         self._captcha_token_expire: float = 0
+        # 两个 Token 中较早的过期时间，供 _ensure_tokens_valid 快速判断
+        self._min_expire: float = 0
 
         # token 更新时间戳（用于防回滚）
         self._token_updated_at: float = time.time()
@@ -146,6 +252,33 @@ class XunleiAdapter(BaseCloudDriveAdapter):
         # 线程锁
         self._token_lock = threading.Lock()
 
+        # 后台 Token 刷新线程
+        self._last_used: float = 0
+        self._refresh_stop = threading.Event()
+        self._refresh_thread: Optional[threading.Thread] = None
+
+        # _find_by_name 的目录名称索引缓存：逐级解析/创建同一父目录下的多个路径时复用
+        self._dir_cache: TTLCache = TTLCache(maxsize=256, ttl=self.DIR_CACHE_TTL)
+        self._dir_cache_lock = threading.Lock()
+
+    @classmethod
+    def _mount_http_adapter(cls, session: requests.Session):
+        """
+        挂载带连接池与传输层重试的 HTTPAdapter。
+        状态码重试只针对 GET/PATCH 等幂等请求；POST（转存、建目录、刷新 token）
+        仅在连接未建立时由 urllib3 重试，避免服务端已处理的请求被重复提交。
+        """
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "PATCH"]),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=cls.POOL_MAXSIZE, max_retries=retry)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
     # ==================== Token 管理 ====================
 
     def _refresh_access_token(self) -> bool:
@@ -161,22 +294,19 @@ class XunleiAdapter(BaseCloudDriveAdapter):
                 "grant_type": "refresh_token",
                 "refresh_token": self._refresh_token,
             }
-            # Token 刷新请求不需要 Authorization 和 captcha
-            headers = {
-                "Content-Type": "application/json",
-                "User-Agent": XUNLEI_UA,
-            }
 
-            resp = requests.post(url, json=data, headers=headers, timeout=30)
+            # Token 刷新请求不需要 Authorization 和 captcha
+            resp = self._auth_session.post(url, data=json_dumps(data), timeout=30)
             result = resp.json()
 
             if "access_token" not in result:
                 error = result.get("error_description", result.get("error", "未知错误"))
-                logging.error(f"[Xunlei] 刷新 access_token 失败: {error}")
+                logging.error("[Xunlei] 刷新 access_token 失败: %s", error)
                 return False
 
             self._access_token = result["access_token"]
-            self._access_token_expire = time.time() + int(result.get("expires_in", 7200)) - 120
+            self._access_token_expire = time.monotonic() + int(result.get("expires_in", 7200)) - 120
+            self._min_expire = min(self._access_token_expire, self._captcha_token_expire)
 
             # 更新 refresh_token
             new_refresh = result.get("refresh_token", "")
@@ -194,11 +324,12 @@ class XunleiAdapter(BaseCloudDriveAdapter):
             self._session.headers["Authorization"] = f"Bearer {self._access_token}"
             self._session.headers["x-device-id"] = self._device_id
 
-            logging.debug(f"[Xunlei] access_token 刷新成功，用户: {self._user_name or self._user_id}")
+            if _debug_enabled():
+                logging.debug("[Xunlei] access_token 刷新成功，用户: %s", self._user_name or self._user_id)
             return True
 
         except Exception as e:
-            logging.error(f"[Xunlei] 刷新 access_token 异常: {e}")
+            logging.error("[Xunlei] 刷新 access_token 异常: %s", e)
             return False
 
     def _refresh_captcha_token(self) -> bool:
@@ -220,21 +351,18 @@ class XunleiAdapter(BaseCloudDriveAdapter):
                     "user_id": self._user_id or "0",
                 },
             }
-            headers = {
-                "Content-Type": "application/json",
-                "User-Agent": XUNLEI_UA,
-            }
 
-            resp = requests.post(url, json=data, headers=headers, timeout=30)
+            resp = self._auth_session.post(url, data=json_dumps(data), timeout=30)
             result = resp.json()
 
             if "captcha_token" not in result:
                 error = result.get("error_description", result.get("error", "未知错误"))
-                logging.error(f"[Xunlei] 获取 captcha_token 失败: {error}")
+                logging.error("[Xunlei] 获取 captcha_token 失败: %s", error)
                 return False
 
             self._captcha_token = result["captcha_token"]
-            self._captcha_token_expire = time.time() + int(result.get("expires_in", 300)) - 10
+            self._captcha_token_expire = time.monotonic() + int(result.get("expires_in", 300)) - 10
+            self._min_expire = min(self._access_token_expire, self._captcha_token_expire)
 
             # 更新 session headers
             self._session.headers["x-captcha-token"] = self._captcha_token
@@ -243,37 +371,86 @@ class XunleiAdapter(BaseCloudDriveAdapter):
             return True
 
         except Exception as e:
-            logging.error(f"[Xunlei] 获取 captcha_token 异常: {e}")
+            logging.error("[Xunlei] 获取 captcha_token 异常: %s", e)
             return False
 
     def _ensure_tokens_valid(self) -> bool:
-        """确保双 Token 都有效"""
-        access_ok = self._access_token and time.time() < self._access_token_expire
-        captcha_ok = self._captcha_token and time.time() < self._captcha_token_expire
-
-        if access_ok and captcha_ok:
+        """
+        确保双 Token 都有效。
+        _min_expire 即"两个 Token 均有效至"的截止时间（已预留提前量），
+        每次 API 调用（含 query_task 轮询）在有效期内只需一次比较即返回。
+        """
+        now = time.monotonic()
+        self._last_used = now
+        # 快速路径：两个 Token 均未过期（过期时间仅在刷新成功时设置，未获取时为 0）
+        if now < self._min_expire:
             return True
 
+        # 等锁的线程在锁内重新检查：前一个持锁线程已完成刷新时直接返回，不会重复刷新
         with self._token_lock:
-            # 双重检查
-            access_ok = self._access_token and time.time() < self._access_token_expire
-            captcha_ok = self._captcha_token and time.time() < self._captcha_token_expire
+            # 走到同步刷新说明后台线程未在运行（空闲退出、尚未启动或本进程未启用）
+            self._start_token_refresher()
 
-            if not access_ok:
+            if not (self._access_token and time.monotonic() < self._access_token_expire):
                 if not self._refresh_access_token():
                     return False
 
-            if not captcha_ok:
+            # 刷新 access_token 可能耗时数秒，captcha_token 需按当前时间重新判断
+            if not (self._captcha_token and time.monotonic() < self._captcha_token_expire):
                 if not self._refresh_captcha_token():
                     return False
 
         return True
 
+    def _start_token_refresher(self):
+        """启动后台 Token 刷新线程（已在运行时不重复启动；未启用后台刷新时不启动）"""
+        if not _background_refresh_enabled or self._refresh_stop.is_set():
+            return
+        thread = self._refresh_thread
+        if thread is not None and thread.is_alive():
+            return
+        self._last_used = time.monotonic()
+        self._refresh_thread = threading.Thread(
+            target=self._token_refresh_loop, name=f"xunlei-token-{self.index}", daemon=True
+        )
+        self._refresh_thread.start()
+
+    def _token_refresh_loop(self):
+        """在 Token 过期前提前刷新，请求线程读取缓存的 Token 而无需等待刷新"""
+        while not self._refresh_stop.is_set():
+            now = time.monotonic()
+            if now - self._last_used > self.TOKEN_IDLE_TIMEOUT:
+                # 长时间无请求：退出线程，下次请求时同步刷新并重新启动
+                return
+            delay = self._min_expire - now - self.TOKEN_REFRESH_AHEAD
+            if delay > 0:
+                self._refresh_stop.wait(delay)
+                continue
+
+            with self._token_lock:
+                now = time.monotonic()
+                ok = True
+                if now + self.TOKEN_REFRESH_AHEAD >= self._access_token_expire:
+                    ok = self._refresh_access_token()
+                if ok and now + self.TOKEN_REFRESH_AHEAD >= self._captcha_token_expire:
+                    ok = self._refresh_captcha_token()
+            if not ok:
+                # 刷新失败时稍后重试，期间请求线程仍可同步刷新
+                self._refresh_stop.wait(self.TOKEN_REFRESH_AHEAD)
+
+    def close(self):
+        """停止后台 Token 刷新线程"""
+        self._refresh_stop.set()
+        thread = self._refresh_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=1)
+        self._refresh_thread = None
+
     def _save_refresh_token(self):
         """保存新的 refresh_token 到配置文件"""
         global _global_config_saver
         if _global_config_saver:
-            _global_config_saver(self._refresh_token, self._account_name)
+            _global_config_saver(self._refresh_token, self._account_name, adapter=self)
             self._token_updated_at = time.time()
 
     # ==================== 请求方法 ====================
@@ -284,19 +461,48 @@ class XunleiAdapter(BaseCloudDriveAdapter):
             return {"error": "TokenInvalid", "error_description": "Token 无效"}
 
         try:
+            # 请求体预先序列化为 bytes，Content-Type 已由 session 统一设置
+            data = json_dumps(body) if body is not None else None
             if method.upper() == "GET":
                 resp = self._session.get(url, params=params, timeout=30)
             elif method.upper() == "PATCH":
-                resp = self._session.patch(url, json=body, params=params, timeout=30)
+                resp = self._session.patch(url, data=data, params=params, timeout=30)
             else:
-                resp = self._session.post(url, json=body, params=params, timeout=30)
+                resp = self._session.post(url, data=data, params=params, timeout=30)
 
-            return resp.json()
+            return json_loads(resp.content)
 
         except Exception as e:
-            logging.error(f"[Xunlei] HTTP 请求失败: {e}")
+            logging.error("[Xunlei] HTTP 请求失败: %s", e)
             return {"error": "RequestError", "error_description": str(e)}
 
+    def _iter_pages(self, url: str, params: Dict, max_items: int = 0) -> Iterator[Dict]:
+        """
+        按 next_page_token 逐页拉取列表，逐页产出原始响应。
+        下一页的 token 只能从当前页获得，无法整体并发；但在调用方处理当前页的同时
+        预取下一页，将结果转换移出请求的关键路径。
+        Args:
+            url: 列表接口地址
+            params: 除 page_token 外的请求参数
+            max_items: 调用方最多需要的条目数，累计达到后不再预取，0 表示不限制
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            result = self._request("GET", url, params=params)
+            fetched = 0
+            while True:
+                future = None
+                if not self._has_error(result):
+                    fetched += len(result.get("files", []))
+                    page_token = result.get("next_page_token", "")
+                    if page_token and not (max_items > 0 and fetched >= max_items):
+                        future = executor.submit(
+                            self._request, "GET", url, None, {**params, "page_token": page_token}
+                        )
+                yield result
+                if future is None:
+                    return
+                result = future.result()
+
     def _get_error_message(self, result: Dict) -> str:
         """从响应中提取错误信息"""
         if "error_description" in result:
@@ -321,14 +527,8 @@ class XunleiAdapter(BaseCloudDriveAdapter):
         size = int(item.get("size", 0) or 0)
 
         # 时间解析
-        updated_at = 0
         time_str = item.get("modified_time") or item.get("created_time", "")
-        if time_str:
-            try:
-                dt = datetime.fromisoformat(time_str.replace("Z", "+00:00"))
-                updated_at = int(dt.timestamp() * 1000)
-            except Exception:
-                pass
+        updated_at = _parse_xunlei_time(time_str) if time_str else 0
 
         return {
             "fid": file_id,
@@ -356,6 +556,7 @@ class XunleiAdapter(BaseCloudDriveAdapter):
 
         self.is_active = True
         self.nickname = self._user_name or f"迅雷用户{self.index}"
+        self._start_token_refresher()
 
         return {
             "user_id": self._user_id,
@@ -410,7 +611,7 @@ class XunleiAdapter(BaseCloudDriveAdapter):
                 "message": "success",
             }
         except Exception as e:
-            logging.error(f"[Xunlei] 获取分享令牌失败: {e}")
+            logging.error("[Xunlei] 获取分享令牌失败: %s", e)
             return {"status": 500, "code": 1, "message": str(e)}
 
     def get_detail(
@@ -424,26 +625,22 @@ class XunleiAdapter(BaseCloudDriveAdapter):
         """获取分享文件详情列表"""
         try:
             file_list = []
-            page_token = ""
-
-            while True:
-                params = {
-                    "share_id": pwd_id,
-                    "pass_code_token": stoken,
-                    "limit": 100,
-                    "page_token": page_token,
-                    "thumbnail_size": "SIZE_SMALL",
-                }
-
-                # 如果指定了子目录
-                if pdir_fid and pdir_fid != "0":
-                    params["parent_id"] = pdir_fid
-                    url = f"{API_BASE}/drive/v1/share/detail"
-                else:
-                    url = f"{API_BASE}/drive/v1/share"
+            params = {
+                "share_id": pwd_id,
+                "pass_code_token": stoken,
+                "limit": 100,
+                "page_token": "",
+                "thumbnail_size": "SIZE_SMALL",
+            }
 
-                result = self._request("GET", url, params=params)
+            # 如果指定了子目录
+            if pdir_fid and pdir_fid != "0":
+                params["parent_id"] = pdir_fid
+                url = f"{API_BASE}/drive/v1/share/detail"
+            else:
+                url = f"{API_BASE}/drive/v1/share"
 
+            for result in self._iter_pages(url, params):
                 if self._has_error(result):
                     msg = self._get_error_message(result)
                     return {"code": 1, "message": msg, "data": {"list": []}}
@@ -452,10 +649,6 @@ class XunleiAdapter(BaseCloudDriveAdapter):
                 for item in files:
                     file_list.append(self._convert_xunlei_item(item))
 
-                page_token = result.get("next_page_token", "")
-                if not page_token:
-                    break
-
             return {
                 "code": 0,
                 "message": "success",
@@ -464,7 +657,7 @@ class XunleiAdapter(BaseCloudDriveAdapter):
             }
 
         except Exception as e:
-            logging.error(f"[Xunlei] 获取分享详情失败: {e}")
+            logging.error("[Xunlei] 获取分享详情失败: %s", e)
             return {"code": 1, "message": str(e), "data": {"list": []}}
 
     def ls_dir(self, pdir_fid: str, max_items: int = 0, **kwargs) -> Dict:
@@ -474,29 +667,18 @@ class XunleiAdapter(BaseCloudDriveAdapter):
 
         try:
             file_list = []
-            page_token = ""
-            
+
             # 判断是否是根目录
             is_root = not pdir_fid or str(pdir_fid) == "0" or str(pdir_fid) == ""
 
-            while True:
-                params = {
-                    "filters": FILE_LIST_FILTERS,
-                    "with_audit": "true",
-                    "thumbnail_size": "SIZE_SMALL",
-                    "limit": 100,
-                }
-                
-                # 只有访问子目录时才传递 parent_id 参数
-                # 根目录时不传递 parent_id 参数
-                if not is_root:
-                    params["parent_id"] = str(pdir_fid)
-                
-                if page_token:
-                    params["page_token"] = page_token
+            params = _LS_BASE_PARAMS.copy()
 
-                result = self._request("GET", f"{API_BASE}/drive/v1/files", params=params)
+            # 只有访问子目录时才传递 parent_id 参数
+            # 根目录时不传递 parent_id 参数
+            if not is_root:
+                params["parent_id"] = str(pdir_fid)
 
+            for result in self._iter_pages(f"{API_BASE}/drive/v1/files", params, max_items):
                 if self._has_error(result):
                     msg = self._get_error_message(result)
                     return {"code": 1, "message": msg, "data": {"list": []}}
@@ -510,10 +692,6 @@ class XunleiAdapter(BaseCloudDriveAdapter):
                     file_list = file_list[:max_items]
                     break
 
-                page_token = result.get("next_page_token", "")
-                if not page_token:
-                    break
-
             return {
                 "code": 0,
                 "message": "success",
@@ -522,7 +700,7 @@ class XunleiAdapter(BaseCloudDriveAdapter):
             }
 
         except Exception as e:
-            logging.error(f"[Xunlei] 列出目录失败: {e}")
+            logging.error("[Xunlei] 列出目录失败: %s", e)
             return {"code": 1, "message": str(e), "data": {"list": []}}
 
     def save_file(
@@ -551,6 +729,7 @@ class XunleiAdapter(BaseCloudDriveAdapter):
             }
 
             result = self._request("POST", f"{API_BASE}/drive/v1/share/restore", body=body)
+            self._invalidate_dir_cache(parent_id)
 
             if self._has_error(result):
                 msg = self._get_error_message(result)
@@ -578,7 +757,7 @@ class XunleiAdapter(BaseCloudDriveAdapter):
             }
 
         except Exception as e:
-            logging.error(f"[Xunlei] 转存失败: {e}")
+            logging.error("[Xunlei] 转存失败: %s", e)
             return {"code": 1, "message": str(e), "data": {}}
 
     def query_task(self, task_id: str) -> Dict:
@@ -593,9 +772,10 @@ class XunleiAdapter(BaseCloudDriveAdapter):
             }
 
         retry_index = 0
-        max_retries = 60
+        # 按墙钟时间限制总等待，轮询间隔指数退避（0.3s 起，封顶 3s）
+        deadline = time.monotonic() + self.TASK_POLL_TIMEOUT
 
-        while retry_index < max_retries:
+        while time.monotonic() < deadline:
             try:
                 result = self._request("GET", f"{API_BASE}/drive/v1/tasks/{task_id}")
 
@@ -608,13 +788,14 @@ class XunleiAdapter(BaseCloudDriveAdapter):
 
                 # 任务完成
                 if progress == 100 or phase == "PHASE_TYPE_COMPLETE":
+                    self._invalidate_dir_cache()
                     # 提取转存后的文件ID
                     save_as_top_fids = []
                     params = result.get("params", {})
                     trace_ids_str = params.get("trace_file_ids", "")
                     if trace_ids_str:
                         try:
-                            trace_data = json.loads(trace_ids_str)
+                            trace_data = json_loads(trace_ids_str)
                             if isinstance(trace_data, dict):
                                 save_as_top_fids = list(trace_data.values())
                             elif isinstance(trace_data, list):
@@ -642,14 +823,15 @@ class XunleiAdapter(BaseCloudDriveAdapter):
                     return {"status": 500, "code": 1, "message": msg, "data": {"status": -1}}
 
                 # 任务进行中
-                if retry_index == 0:
-                    logging.debug(f"[Xunlei] 等待任务执行: {result.get('name', task_id)}")
+                if retry_index == 0 and _debug_enabled():
+                    logging.debug("[Xunlei] 等待任务执行: %s", result.get('name', task_id))
 
+                delay = min(3.0, 0.3 * (1.7 ** retry_index))
                 retry_index += 1
-                time.sleep(0.5)
+                time.sleep(delay + random.uniform(0, 0.1))
 
             except Exception as e:
-                logging.error(f"[Xunlei] 查询任务失败: {e}")
+                logging.error("[Xunlei] 查询任务失败: %s", e)
                 return {"status": 500, "code": 1, "message": str(e), "data": {"status": 0}}
 
         return {
@@ -690,6 +872,7 @@ class XunleiAdapter(BaseCloudDriveAdapter):
                 }
 
                 result = self._request("POST", f"{API_BASE}/drive/v1/files", body=body)
+                self._invalidate_dir_cache(parent_id)
 
                 if self._has_error(result):
                     msg = self._get_error_message(result)
@@ -705,27 +888,61 @@ class XunleiAdapter(BaseCloudDriveAdapter):
                 "data": {"fid": created_id, "file_name": created_name},
             }
         except Exception as e:
-            logging.error(f"[Xunlei] 创建目录失败: {e}")
+            logging.error("[Xunlei] 创建目录失败: %s", e)
             return {"code": 1, "message": str(e)}
 
-    def _find_by_name(self, parent_id: str, name: str, kind: str = None) -> Optional[Dict]:
-        """在指定目录下按名称查找文件/文件夹"""
-        try:
-            params = {
-                "parent_id": parent_id,
-                "filters": FILE_LIST_FILTERS,
-                "limit": 100,
-            }
-            result = self._request("GET", f"{API_BASE}/drive/v1/files", params=params)
+    def _list_by_name(self, parent_id: str, no_cache: bool = False) -> Tuple[Dict[str, List[Dict]], bool]:
+        """
+        列出目录并按名称建立索引，仅缓存成功结果。
+        Returns:
+            (名称 -> 同名条目列表, 是否来自缓存)
+        """
+        if not no_cache:
+            with self._dir_cache_lock:
+                by_name = self._dir_cache.get(parent_id)
+            if by_name is not None:
+                return by_name, True
+        params = dict(_FIND_BASE_PARAMS, parent_id=parent_id)
+        result = self._request("GET", f"{API_BASE}/drive/v1/files", params=params)
+        # 名称 -> 同名条目列表（保持原顺序：同名的文件与文件夹可并存）
+        by_name = {}
+        for item in result.get("files", []):
+            by_name.setdefault(item.get("name"), []).append(item)
+        if not self._has_error(result):
+            with self._dir_cache_lock:
+                self._dir_cache[parent_id] = by_name
+        return by_name, False
 
-            for item in result.get("files", []):
-                if item.get("name") == name:
-                    if kind is None or item.get("kind") == kind:
-                        return item
+    def _find_by_name(self, parent_id: str, name: str, kind: str = None) -> Optional[Dict]:
+        """在指定目录下按名称查找文件/文件夹；缓存中未命中时重新列目录确认一次"""
+        def match(by_name):
+            for item in by_name.get(name, ()):
+                if kind is None or item.get("kind") == kind:
+                    return item
             return None
+
+        try:
+            by_name, cached = self._list_by_name(parent_id)
+            item = match(by_name)
+            if item is None and cached:
+                # 缓存可能早于其他进程/网页端的改动，不能据此判定不存在
+                item = match(self._list_by_name(parent_id, no_cache=True)[0])
+            return item
         except Exception:
             return None
 
+    def _invalidate_dir_cache(self, parent_id: str = None):
+        """
+        失效目录列表缓存。
+        Args:
+            parent_id: 指定目录（根目录为 ""），None 时清空全部
+        """
+        with self._dir_cache_lock:
+            if parent_id is None:
+                self._dir_cache.clear()
+            else:
+                self._dir_cache.pop(parent_id, None)
+
     def rename(self, fid: str, file_name: str) -> Dict:
         """重命名文件"""
         if not self._ensure_tokens_valid():
@@ -734,6 +951,7 @@ class XunleiAdapter(BaseCloudDriveAdapter):
         try:
             body = {"name": file_name}
             result = self._request("PATCH", f"{API_BASE}/drive/v1/files/{fid}", body=body)
+            self._invalidate_dir_cache()
 
             if self._has_error(result):
                 msg = self._get_error_message(result)
@@ -741,7 +959,7 @@ class XunleiAdapter(BaseCloudDriveAdapter):
 
             return {"code": 0, "message": "success"}
         except Exception as e:
-            logging.error(f"[Xunlei] 重命名失败: {e}")
+            logging.error("[Xunlei] 重命名失败: %s", e)
             return {"code": 1, "message": str(e)}
 
     def delete(self, filelist: List[str]) -> Dict:
@@ -752,6 +970,7 @@ class XunleiAdapter(BaseCloudDriveAdapter):
         try:
             body = {"ids": filelist, "space": ""}
             result = self._request("POST", f"{API_BASE}/drive/v1/files:batchDelete", body=body)
+            self._invalidate_dir_cache()
 
             if self._has_error(result):
                 msg = self._get_error_message(result)
@@ -759,7 +978,7 @@ class XunleiAdapter(BaseCloudDriveAdapter):
 
             return {"code": 0, "message": "success"}
         except Exception as e:
-            logging.error(f"[Xunlei] 删除失败: {e}")
+            logging.error("[Xunlei] 删除失败: %s", e)
             return {"code": 1, "message": str(e)}
 
     def get_fids(self, file_paths: List[str]) -> List[Dict]:
@@ -767,29 +986,30 @@ class XunleiAdapter(BaseCloudDriveAdapter):
         if not self._ensure_tokens_valid():
             return []
 
-        results = []
+        if len(file_paths) <= 1:
+            resolved = [self._resolve_path(path) for path in file_paths]
+        else:
+            # 各路径互不依赖：并发逐级解析，按输入顺序返回
+            with ThreadPoolExecutor(max_workers=min(self.FIDS_MAX_WORKERS, len(file_paths))) as executor:
+                resolved = list(executor.map(self._resolve_path, file_paths))
 
-        for path in file_paths:
-            if not path or path == "/":
-                results.append({"file_path": "/", "fid": ""})
-                continue
+        return [r for r in resolved if r]
 
-            parts = [p for p in path.strip("/").split("/") if p]
-            parent_id = ""
-            found = True
+    def _resolve_path(self, path: str) -> Optional[Dict]:
+        """逐级查找单个路径，返回 {"file_path", "fid"}，不存在时返回 None"""
+        if not path or path == "/":
+            return {"file_path": "/", "fid": ""}
 
-            for name in parts:
-                item = self._find_by_name(parent_id, name)
-                if item:
-                    parent_id = item.get("id", "")
-                else:
-                    found = False
-                    break
+        parts = [p for p in path.strip("/").split("/") if p]
+        parent_id = ""
 
-            if found:
-                results.append({"file_path": path, "fid": parent_id})
+        for name in parts:
+            item = self._find_by_name(parent_id, name)
+            if not item:
+                return None
+            parent_id = item.get("id", "")
 
-        return results
+        return {"file_path": path, "fid": parent_id}
 
     def extract_url(self, url: str) -> Tuple[Optional[str], str, Any, List]:
         """
@@ -806,7 +1026,7 @@ class XunleiAdapter(BaseCloudDriveAdapter):
         paths = []
 
         # 提取分享 ID
-        match_s = re.search(r"pan\.xunlei\.com/s/([a-zA-Z0-9_-]+)", url)
+        match_s = _RE_SHARE.search(url)
         if match_s:
             pwd_id = match_s.group(1)
             # 去除 query string
@@ -816,14 +1036,14 @@ class XunleiAdapter(BaseCloudDriveAdapter):
                 pwd_id = pwd_id.split("#")[0]
 
         # 提取提取码
-        match_pwd = re.search(r"(?:pwd|password)=([a-zA-Z0-9]+)", url)
+        match_pwd = _RE_PWD.search(url)
         if match_pwd:
             passcode = match_pwd.group(1)
 
         # 提取子目录 ID
         if "#/list/share/" in url:
-            raw_fid = url.split("#/list/share/")[-1]
-            match_fid = re.match(r"(\w+)", raw_fid)
+            raw_fid = url.rpartition("#/list/share/")[2]
+            match_fid = _RE_FID.match(raw_fid)
             if match_fid:
                 pdir_fid = match_fid.group(1)
 
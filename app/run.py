@@ -16,6 +16,7 @@ from flask import (
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from sdk.cloudsaver import CloudSaver
 from sdk.pansou import PanSou
 from datetime import datetime, timezone, timedelta
@@ -26,7 +27,10 @@ import secrets
 import logging
 import traceback
 import base64
+import copy
 import queue
+import selectors
+import shutil
 import threading
 import sys
 import os
@@ -56,7 +60,7 @@ except ImportError:
 
 parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, parent_dir)
-from quark_auto_save import Quark, Config, MagicRename
+from quark_auto_save import Quark, Config, MagicRename, FileNameList
 
 # 尝试导入多网盘支持模块
 try:
@@ -65,6 +69,9 @@ try:
         QuarkAdapter, Cloud115Adapter,
         BaiduAdapter, XunleiAdapter, AliyunAdapter, UCAdapter
     )
+    from adapters.aliyun_adapter import set_config_saver as aliyun_set_config_saver
+    from adapters.xunlei_adapter import set_config_saver as xunlei_set_config_saver
+    from adapters.xunlei_adapter import enable_background_refresh as xunlei_enable_background_refresh
     MULTI_DRIVE_SUPPORT = True
 except ImportError:
     MULTI_DRIVE_SUPPORT = False
@@ -125,6 +132,14 @@ DEBUG = os.environ.get("DEBUG", "false").lower() == "true"
 HOST = os.environ.get("HOST", "0.0.0.0")
 PORT = os.environ.get("PORT", 5005)
 TASK_TIMEOUT = int(os.environ.get("TASK_TIMEOUT", 1800))
+# 手动运行日志流无输出时发送 SSE 心跳的间隔（秒）
+SSE_HEARTBEAT_INTERVAL = 15
+# 后台配置写入队列上限（条）
+CONFIG_WRITE_QUEUE_SIZE = 64
+# favicon 浏览器缓存时长（秒）
+FAVICON_MAX_AGE = 86400 * 30
+# 无法 select 的管道由读取线程转交输出，队列上限（块数）
+SSE_READER_QUEUE_SIZE = 64
 
 config_data = {}
 task_plugins_config_default = {}
@@ -142,6 +157,29 @@ _cancel_events_lock = threading.Lock()
 _run_procs_lock = threading.Lock()
 _run_procs = {}
 
+# 资源搜索共用的 HTTP 会话：各次搜索复用 keep-alive 连接，免去重复 TCP/TLS 握手
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=16))
+_HTTP_SESSION.mount("http://", requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=16))
+# 网络公开资源搜索服务地址（导入时解码一次）
+_NET_BASE_URL = base64.b64decode("aHR0cHM6Ly9zLjkxNzc4OC54eXo=").decode()
+# PanSou 客户端无认证状态，按服务地址复用实例（及其连接池）
+_pansou_clients = {}
+
+# 配置文件解析缓存：文件可能被任务子进程、token 保存器直接改写，
+# 以 (inode, 大小, 修改时间) 判断文件是否变化，未变化时复用上次解析结果
+_config_file_cache = {"key": None, "data": None}
+_config_file_cache_lock = threading.Lock()
+# 串行化配置的读-改-写（/update 与各个直接修改 config_data 的接口共用）
+_config_update_lock = threading.Lock()
+# 串行化配置文件写入及解析缓存的更新
+_config_write_lock = threading.Lock()
+# 后台配置写入：单一写入线程 + 有界队列
+_config_write_queue = queue.Queue(maxsize=CONFIG_WRITE_QUEUE_SIZE)
+_config_writer = None
+_config_writer_lock = threading.Lock()
+_MISSING = object()
+
 app = Flask(__name__)
 app.config["APP_VERSION"] = get_app_ver()
 
@@ -254,15 +292,127 @@ if not DEBUG:
 
 
 def gen_md5(string):
-    md5 = hashlib.md5()
-    md5.update(string.encode("utf-8"))
-    return md5.hexdigest()
+    # 仅用于生成非安全用途的登录令牌，走 OpenSSL 一次性计算
+    return hashlib.new("md5", string.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+
+# 登录 token 缓存：仅在 webui 账号密码变化时重新计算
+_LOGIN_TOKEN_CACHE = {"creds": None, "token": None}
 
 
 def get_login_token():
-    username = config_data["webui"]["username"]
-    password = config_data["webui"]["password"]
-    return gen_md5(f"token{username}{password}+-*/")[8:24]
+    creds = (config_data["webui"]["username"], config_data["webui"]["password"])
+    if _LOGIN_TOKEN_CACHE["creds"] != creds:
+        username, password = creds
+        _LOGIN_TOKEN_CACHE["token"] = gen_md5(f"token{username}{password}+-*/")[8:24]
+        _LOGIN_TOKEN_CACHE["creds"] = creds
+    return _LOGIN_TOKEN_CACHE["token"]
+
+
+def _config_file_key():
+    st = os.stat(CONFIG_PATH)
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def read_config_cached():
+    """读取配置文件，文件未变化时返回缓存的解析结果（调用方不得原地修改）"""
+    key = _config_file_key()
+    with _config_file_cache_lock:
+        if _config_file_cache["key"] == key:
+            return _config_file_cache["data"]
+    data = Config.read_json(CONFIG_PATH)
+    with _config_file_cache_lock:
+        _config_file_cache["key"] = key
+        _config_file_cache["data"] = data
+    return data
+
+
+def write_config_cached(data):
+    """写入配置文件，并将写入内容记为当前文件的解析结果（data 写入后即归缓存所有，调用方不得再原地修改）"""
+    with _config_write_lock:
+        try:
+            Config.write_json(CONFIG_PATH, data)
+            key = _config_file_key()
+        except Exception:
+            with _config_file_cache_lock:
+                _config_file_cache["key"] = None
+            raise
+        with _config_file_cache_lock:
+            _config_file_cache["key"] = key
+            _config_file_cache["data"] = data
+
+
+def apply_config_patch(mutate):
+    """在磁盘最新配置上执行 mutate 并写盘，再对内存 config_data 打同样的补丁（调用方需持有配置锁）
+
+    任务子进程可能已改写配置文件（如轮换了其他账户的 token），不能把过期的内存副本整体写回。
+    """
+    fresh = copy.deepcopy(read_config_cached())
+    mutate(fresh)
+    write_config_cached(fresh)
+    mutate(config_data)
+
+
+def account_token_patch(drive_type, account_name, new_token):
+    """生成更新账户 refresh_token 的补丁；account_name 为 None 时更新该类型的全部账户"""
+
+    def mutate(data):
+        now = time.time()
+        for acc in data.get("accounts", []):
+            if acc.get("drive_type") != drive_type:
+                continue
+            if account_name is not None and acc.get("name", "") != account_name:
+                continue
+            acc["cookie"] = new_token
+            acc["_token_updated_at"] = now
+            if account_name is not None:
+                break
+
+    return mutate
+
+
+def _config_writer_loop():
+    """后台配置写入线程：按入队顺序逐个以 apply_config_patch 执行修改并写盘"""
+    while True:
+        mutate = _config_write_queue.get()
+        try:
+            with _config_update_lock:
+                apply_config_patch(mutate)
+        except Exception as e:
+            logging.error(f">>> 后台保存配置失败: {e}")
+
+
+def save_config_async(mutate):
+    """将配置修改交给唯一的后台写入线程（整个读-改-写持有配置锁，与 /update 互斥）
+
+    mutate 会先后作用于磁盘最新配置与内存 config_data，只应修改目标字段。
+
+    队列有界，积压过多时调用方阻塞等待，不丢弃任何修改。
+    """
+    global _config_writer
+    with _config_writer_lock:
+        if _config_writer is None:
+            _config_writer = threading.Thread(target=_config_writer_loop, daemon=True)
+            _config_writer.start()
+    _config_write_queue.put(mutate)
+
+
+def _make_token_saver(drive_type):
+    """生成 WebUI 进程内的 refresh_token 保存函数
+
+    适配器刷新出新 token 后经 save_config_async 在配置锁内重读配置文件、只修改对应账户的
+    cookie/_token_updated_at 并写盘，再同步到 config_data（否则可能与 /update 互相覆盖）；
+    同时把该实例登记到新 token 对应的缓存键，避免按新 token 查找时再建实例、再次轮换。
+    """
+
+    def save(new_refresh_token, account_name=None, adapter=None):
+        if adapter is not None:
+            AdapterFactory.cache_adapter(drive_type, new_refresh_token, adapter)
+
+        save_config_async(account_token_patch(drive_type, account_name or None, new_refresh_token))
+        return True
+
+    return save
 
 
 def is_login():
@@ -273,6 +423,62 @@ def is_login():
         return False
 
 
+# 账户索引：随 config_data["accounts"] 列表对象的替换自动重建
+_account_index = {
+    "source": None,     # 建索引时的 accounts 列表对象
+    "by_name": {},      # 名称 -> 已启用账户（同名取第一个）
+    "by_type": {},      # 网盘类型 -> [已启用账户]（保持配置顺序）
+    "all_by_type": {},  # 网盘类型 -> [全部账户]（含未启用，供 token 管理接口使用）
+    "by_type_name": {}, # (网盘类型, 名称) -> 账户（含未启用，同名取第一个）
+    "default": None,    # 默认账户：首个标记 is_default/default 的已启用账户，否则为首个已启用账户
+}
+_account_index_lock = threading.Lock()
+
+
+def _rebuild_account_index():
+    """按当前 config_data["accounts"] 重建账户索引"""
+    accounts = config_data.get("accounts") or []
+    by_name, by_type, all_by_type, by_type_name = {}, {}, {}, {}
+    default = first_enabled = None
+    for acc in accounts:
+        drive_type = acc.get("drive_type")
+        all_by_type.setdefault(drive_type, []).append(acc)
+        by_type_name.setdefault((drive_type, acc.get("name")), acc)
+        if not acc.get("enabled", True):
+            continue
+        by_name.setdefault(acc.get("name"), acc)
+        by_type.setdefault(drive_type, []).append(acc)
+        if first_enabled is None:
+            first_enabled = acc
+        if default is None and (acc.get("is_default") or acc.get("default")):
+            default = acc
+    with _account_index_lock:
+        _account_index.update(
+            source=accounts,
+            by_name=by_name,
+            by_type=by_type,
+            all_by_type=all_by_type,
+            by_type_name=by_type_name,
+            default=default or first_enabled,
+        )
+
+
+def _get_account_index():
+    """获取账户索引，accounts 列表被整体替换（如 /update）后自动重建"""
+    if _account_index["source"] is not config_data.get("accounts"):
+        _rebuild_account_index()
+    return _account_index
+
+
+def find_account(drive_type, account_name=""):
+    """按网盘类型查找账户（含未启用），指定名称时匹配名称，否则取该类型第一个"""
+    index = _get_account_index()
+    if account_name:
+        return index["by_type_name"].get((drive_type, account_name))
+    accounts = index["all_by_type"].get(drive_type)
+    return accounts[0] if accounts else None
+
+
 def get_account_by_name(account_name=None):
     """
     根据账户名称获取对应的适配器或 Quark 实例
@@ -286,31 +492,20 @@ def get_account_by_name(account_name=None):
     """
     # 检查是否使用新格式配置
     if MULTI_DRIVE_SUPPORT and config_data.get("accounts"):
-        accounts = config_data.get("accounts", [])
-        enabled_accounts = [acc for acc in accounts if acc.get("enabled", True)]
-        
-        if not enabled_accounts:
+        index = _get_account_index()
+
+        if index["default"] is None:
             # 无可用账户，回退到旧格式（通过工厂缓存复用实例）
             if config_data.get("cookie"):
                 return AdapterFactory.create_adapter("quark", config_data["cookie"][0], 0), "quark"
             return None, None
         
-        # 查找指定账户或默认账户
+        # 查找指定账户，未指定或不存在时使用默认账户（或第一个可用账户）
         target_account = None
         if account_name and account_name != "auto":
-            for acc in enabled_accounts:
-                if acc.get("name") == account_name:
-                    target_account = acc
-                    break
-        
+            target_account = index["by_name"].get(account_name)
         if not target_account:
-            # 使用默认账户或第一个可用账户
-            for acc in enabled_accounts:
-                if acc.get("is_default") or acc.get("default"):
-                    target_account = acc
-                    break
-            if not target_account:
-                target_account = enabled_accounts[0]
+            target_account = index["default"]
         
         # 创建适配器
         drive_type = target_account.get("drive_type", "quark")
@@ -339,12 +534,12 @@ def get_adapter_for_url(shareurl):
         shareurl: 分享链接 URL
     
     Returns:
-        tuple: (adapter/quark实例, drive_type)
+        tuple: (adapter/quark实例, drive_type, 按 URL 识别出的网盘类型)
     """
     if not MULTI_DRIVE_SUPPORT:
         if config_data.get("cookie"):
-            return AdapterFactory.create_adapter("quark", config_data["cookie"][0], 0), "quark"
-        return None, None
+            return AdapterFactory.create_adapter("quark", config_data["cookie"][0], 0), "quark", "quark"
+        return None, None, "quark"
     
     # 根据 URL 判断网盘类型
     drive_type = AdapterFactory.get_drive_type_by_url(shareurl)
@@ -354,42 +549,41 @@ def get_adapter_for_url(shareurl):
         logging.warning(f">>> 无法识别的分享链接类型: {shareurl}")
         # 尝试回退到旧格式的夸克
         if config_data.get("cookie"):
-            return AdapterFactory.create_adapter("quark", config_data["cookie"][0], 0), "quark"
-        return None, None
+            return AdapterFactory.create_adapter("quark", config_data["cookie"][0], 0), "quark", drive_type
+        return None, None, drive_type
     
     # 从账户中查找对应类型的可用账户
     if config_data.get("accounts"):
-        accounts = config_data.get("accounts", [])
-        logging.debug(f">>> 查找 {drive_type} 类型账户，共有 {len(accounts)} 个账户")
-        for acc in accounts:
-            acc_enabled = acc.get("enabled", True)
-            acc_type = acc.get("drive_type")
-            logging.debug(f">>>   账户 '{acc.get('name')}': type={acc_type}, enabled={acc_enabled}")
-            if acc_enabled and acc_type == drive_type:
-                cookie = acc.get("cookie", "")
-                logging.info(f">>> 使用账户 '{acc.get('name')}' ({drive_type})")
-                # 使用工厂创建适配器
-                adapter = AdapterFactory.create_adapter(drive_type, cookie, 0)
-                if adapter:
-                    return adapter, drive_type
+        candidates = _get_account_index()["by_type"].get(drive_type, ())
+        logging.debug(f">>> 查找 {drive_type} 类型账户，共有 {len(candidates)} 个可用账户")
+        for acc in candidates:
+            cookie = acc.get("cookie", "")
+            logging.info(f">>> 使用账户 '{acc.get('name')}' ({drive_type})")
+            # 使用工厂创建适配器
+            adapter = AdapterFactory.create_adapter(drive_type, cookie, 0)
+            if adapter:
+                return adapter, drive_type, drive_type
     
     # 回退到旧格式
     if drive_type == "quark" and config_data.get("cookie"):
         logging.info(f">>> 回退到旧格式Cookie配置")
-        return AdapterFactory.create_adapter("quark", config_data["cookie"][0], 0), "quark"
+        return AdapterFactory.create_adapter("quark", config_data["cookie"][0], 0), "quark", drive_type
     
     logging.warning(f">>> 未找到 {drive_type} 类型的可用账户")
-    return None, None
+    return None, None, drive_type
 
 
 # 设置icon
 @app.route("/favicon.ico")
 def favicon():
-    return send_from_directory(
+    response = send_from_directory(
         os.path.join(app.root_path, "static"),
         "favicon.ico",
         mimetype="image/vnd.microsoft.icon",
+        max_age=FAVICON_MAX_AGE,
     )
+    response.cache_control.public = True
+    return response
 
 
 # 登录页面
@@ -437,8 +631,8 @@ def index():
 def get_data():
     if not is_login():
         return jsonify({"success": False, "message": "未登录"})
-    data = Config.read_json(CONFIG_PATH)
-    del data["webui"]
+    # 浅拷贝并去掉 webui，缓存中的解析结果保持不变
+    data = {k: v for k, v in read_config_cached().items() if k != "webui"}
     data["api_token"] = get_login_token()
     data["task_plugins_config_default"] = task_plugins_config_default
     # 添加多网盘支持标识
@@ -452,10 +646,17 @@ def get_data():
 # 更新数据
 @app.route("/update", methods=["POST"])
 def update():
-    global config_data,CONFIG_PATH
     if not is_login():
         return jsonify({"success": False, "message": "未登录"})
-    config_data = Config.read_json(CONFIG_PATH)
+    with _config_update_lock:
+        return _update_config()
+
+
+def _update_config():
+    global config_data
+    # 以磁盘上的最新配置为基准（token 保存器等可能已直接改写文件），
+    # 文件未变化时复用缓存的解析结果；深拷贝后再修改，嵌套的账户/任务对象不与缓存共享
+    config_data = copy.deepcopy(read_config_cached())
 
     dont_save_keys = ["task_plugins_config_default", "api_token", "sync_tasks"]
     
@@ -463,38 +664,35 @@ def update():
     # 对于这两种网盘类型，一旦配置了 cookie，就只能通过专门的刷新接口更新
     incoming_accounts = request.json.get("accounts", [])
     if incoming_accounts and MULTI_DRIVE_SUPPORT:
-        current_accounts = config_data.get("accounts", [])
-        # 构建当前需要 token 保护的账户映射（阿里云盘和迅雷网盘）
-        current_token_protected = {}
-        for acc in current_accounts:
-            if acc.get("drive_type") in ("aliyun", "xunlei"):
-                name = acc.get("name", "")
-                drive_type = acc.get("drive_type")
-                key = f"{drive_type}:{name}"
-                current_cookie = acc.get("cookie", "")
-                if current_cookie:  # 只有已填写 cookie 的账户才需要保护
-                    current_token_protected[key] = {
-                        "cookie": current_cookie,
-                        "_token_updated_at": acc.get("_token_updated_at", 0),
-                    }
+        # 构建当前需要 token 保护的账户映射（只有已填写 cookie 的账户才需要保护）
+        protected = {
+            (acc["drive_type"], acc.get("name", "")): (acc["cookie"], acc.get("_token_updated_at", 0))
+            for acc in config_data.get("accounts", [])
+            if acc.get("drive_type") in ("aliyun", "xunlei") and acc.get("cookie")
+        }
         
         # 对于已有 cookie 的阿里云盘/迅雷网盘账户，强制保留当前配置的 cookie
-        for acc in incoming_accounts:
-            if acc.get("drive_type") in ("aliyun", "xunlei"):
-                name = acc.get("name", "")
-                drive_type = acc.get("drive_type")
-                key = f"{drive_type}:{name}"
-                if key in current_token_protected:
-                    current_info = current_token_protected[key]
+        if protected:
+            for acc in incoming_accounts:
+                if (key := (acc.get("drive_type"), acc.get("name", ""))) in protected:
                     # 无论传入什么值，都使用当前配置的 cookie（防止前端修改）
-                    logging.debug(f"[{drive_type}] 保护账户 {name} 的 token，忽略传入的修改")
-                    acc["cookie"] = current_info["cookie"]
-                    acc["_token_updated_at"] = current_info["_token_updated_at"]
+                    logging.debug(f"[{key[0]}] 保护账户 {key[1]} 的 token，忽略传入的修改")
+                    acc["cookie"], acc["_token_updated_at"] = protected[key]
     
-    for key, value in request.json.items():
-        if key not in dont_save_keys:
-            config_data.update({key: value})
-    Config.write_json(CONFIG_PATH, config_data)
+    changed = {
+        key: value
+        for key, value in request.json.items()
+        if key not in dont_save_keys and config_data.get(key, _MISSING) != value
+    }
+    if not changed:
+        # 提交内容与当前配置一致，跳过写盘与重载
+        logging.debug(">>> 配置无变化，跳过保存")
+        return jsonify({"success": True, "message": "配置更新成功"})
+    config_data.update(changed)
+    # config_data 之后还会被原地打补丁，缓存中存放独立副本
+    write_config_cached(copy.deepcopy(config_data))
+    _LOGIN_TOKEN_CACHE["creds"] = None
+    _rebuild_account_index()
     # 配置变更时清空适配器实例缓存，确保新配置生效
     if MULTI_DRIVE_SUPPORT:
         AdapterFactory.clear_cache()
@@ -508,6 +706,30 @@ def update():
         return jsonify({"success": False, "message": "配置更新失败"})
 
 
+def _pipe_reader(fd, chunks, stop):
+    """后台读取管道输出并放入有界队列，以空字节串表示结束；stop 置位（消费方已退出）后不再投递"""
+    chunk = b""
+    try:
+        while True:
+            chunk = os.read(fd, 65536)
+            while not stop.is_set():
+                try:
+                    chunks.put(chunk, timeout=1)
+                    break
+                except queue.Full:
+                    continue
+            if not chunk or stop.is_set():
+                return
+    except OSError:
+        # 管道已被消费方关闭
+        pass
+    if chunk and not stop.is_set():
+        try:
+            chunks.put(b"", timeout=1)
+        except queue.Full:
+            pass
+
+
 # 处理运行脚本请求
 @app.route("/run_script_now", methods=["POST"])
 def run_script_now():
@@ -539,28 +761,64 @@ def run_script_now():
             command,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            universal_newlines=True,
-            encoding="utf-8",
-            errors="replace",
-            bufsize=1,
+            bufsize=0,
             env=process_env,
         )
         with _run_procs_lock:
             _run_procs[run_id] = {"type": "script", "process": process}
+        fd = process.stdout.fileno()
+        # 以 selector 等待输出：长时间无输出时发送心跳，客户端断开能及时被发现，
+        # 不会一直阻塞在读取上占用请求线程。Windows 的 select 只支持 socket，
+        # 管道改由后台线程阻塞读取并经有界队列转交，请求线程仍可按时发送心跳
+        selector = None
+        chunks = None
+        reader_stop = threading.Event()
+        if os.name == "nt":
+            chunks = queue.Queue(maxsize=SSE_READER_QUEUE_SIZE)
+            threading.Thread(
+                target=_pipe_reader, args=(fd, chunks, reader_stop), daemon=True
+            ).start()
+        else:
+            selector = selectors.DefaultSelector()
+            selector.register(fd, selectors.EVENT_READ)
         try:
-            for line in iter(process.stdout.readline, ""):
-                s = line.rstrip("\n")
-                if s:
-                    logging.info(s)
-                try:
-                    yield f"data: {line}\n\n"
-                except GeneratorExit:
+            pending = b""
+            while True:
+                if selector:
+                    if not selector.select(timeout=SSE_HEARTBEAT_INTERVAL):
+                        yield ": keepalive\n\n"
+                        continue
+                    chunk = os.read(fd, 65536)
+                else:
+                    try:
+                        chunk = chunks.get(timeout=SSE_HEARTBEAT_INTERVAL)
+                    except queue.Empty:
+                        yield ": keepalive\n\n"
+                        continue
+                if not chunk:
                     break
-            try:
-                yield "data: [DONE]\n\n"
-            except GeneratorExit:
-                pass
+                data = pending + chunk
+                cut = data.rfind(b"\n")
+                if cut < 0:
+                    pending = data
+                    continue
+                body, pending = data[:cut], data[cut + 1:]
+                # 整块只解码一次用于日志；SSE 帧直接以字节拼接，一块输出合并为一次 yield
+                for line in body.decode("utf-8", "replace").split("\n"):
+                    if line:
+                        logging.info(line)
+                yield b"data: " + body.replace(b"\n", b"\n\ndata: ") + b"\n\n"
+            if pending:
+                line = pending.decode("utf-8", "replace")
+                logging.info(line)
+                yield f"data: {line}\n\n"
+            yield "data: [DONE]\n\n"
+        except GeneratorExit:
+            pass
         finally:
+            reader_stop.set()
+            if selector:
+                selector.close()
             with _run_procs_lock:
                 _run_procs.pop(run_id, None)
             process.stdout.close()
@@ -601,9 +859,8 @@ def get_task_suggestions():
 
     def net_search():
         if str(net_data.get("enable", "true")).lower() != "false":
-            base_url = base64.b64decode("aHR0cHM6Ly9zLjkxNzc4OC54eXo=").decode()
-            url = f"{base_url}/task_suggestions?q={query}&d={deep}"
-            response = requests.get(url)
+            url = f"{_NET_BASE_URL}/task_suggestions?q={query}&d={deep}"
+            response = _HTTP_SESSION.get(url, timeout=10)
             return response.json()
         return []
 
@@ -621,16 +878,21 @@ def get_task_suggestions():
             )
             search = cs.auto_login_search(query)
             if search.get("success"):
-                if search.get("new_token"):
-                    cs_data["token"] = search.get("new_token")
-                    Config.write_json(CONFIG_PATH, config_data)
+                if new_token := search.get("new_token"):
+                    # token 写盘不影响本次搜索结果，交给后台线程，搜索建议不等待磁盘 IO
+                    save_config_async(
+                        lambda data: data.setdefault("source", {}).setdefault("cloudsaver", {}).update(token=new_token)
+                    )
                 search_results = cs.clean_search_results(search.get("data"))
                 return search_results
         return []
 
     def ps_search():
         if ps_data.get("server"):
-            ps = PanSou(ps_data.get("server"))
+            server = ps_data.get("server")
+            ps = _pansou_clients.get(server)
+            if ps is None:
+                ps = _pansou_clients.setdefault(server, PanSou(server))
             return ps.search(query, deep == "1")
         return []
 
@@ -645,14 +907,14 @@ def get_task_suggestions():
                 result = future.result()
                 search_results.extend(result)
 
-        # 按时间排序并去重
+        # 按时间排序并去重（各来源结果不保证有序，仍做整体排序；去重用集合）
         results = []
-        link_array = []
+        seen_urls = set()
         search_results.sort(key=lambda x: x.get("datetime", ""), reverse=True)
         for item in search_results:
             url = item.get("shareurl", "")
-            if url != "" and url not in link_array:
-                link_array.append(url)
+            if url and url not in seen_urls:
+                seen_urls.add(url)
                 results.append(item)
 
         return jsonify({"success": True, "data": results})
@@ -683,13 +945,15 @@ def get_share_detail():
         # 根据 URL 或指定账户获取适配器
         if account_name and account_name != "auto":
             account, drive_type = get_account_by_name(account_name)
+            detected_type = None
             logger.debug(f"[get_share_detail] 使用指定账户：{account_name}, 类型：{drive_type}")
         else:
-            account, drive_type = get_adapter_for_url(shareurl)
+            account, drive_type, detected_type = get_adapter_for_url(shareurl)
             logger.debug(f"[get_share_detail] 自动检测账户类型：{drive_type}")
         
         if not account:
-            detected_type = AdapterFactory.get_drive_type_by_url(shareurl) if MULTI_DRIVE_SUPPORT else "quark"
+            if detected_type is None:
+                detected_type = AdapterFactory.get_drive_type_by_url(shareurl) if MULTI_DRIVE_SUPPORT else "quark"
             type_label = {"quark": "夸克网盘", "115": "115 网盘"}.get(detected_type, detected_type)
             logger.error(f"[get_share_detail] 未配置{type_label}账户")
             return jsonify({"success": False, "data": {"error": f"未配置有效的{type_label}账户，请先在「系统配置」→「多网盘账户」中添加{type_label}账户"}})
@@ -735,7 +999,7 @@ def get_share_detail():
             if not preview_account or not savepath:
                 return []
             
-            savepath_normalized = re.sub(r'/+', '/', savepath)
+            savepath_normalized = _RE_MULTI_SLASH.sub("/", savepath)
             try:
                 drive_type_key = getattr(preview_account, 'DRIVE_TYPE', 'quark')
                 cookie_key = getattr(preview_account, 'cookie', '')
@@ -817,6 +1081,11 @@ def get_share_detail():
         return jsonify({"success": False, "data": {"error": f"获取分享详情失败: {str(e)}"}})
 
 
+# 预览处理用到的固定正则
+_RE_MULTI_SLASH = re.compile(r"/+")
+_RE_MAGIC_I = re.compile(r"\{I+\}")
+
+
 def _apply_preview_regex(data, task, magic_regex, dir_file_list, preview_account, share_account):
     """
     对分享文件列表应用正则预览处理（纯 CPU 操作，使用预先获取的 dir_file_list）。
@@ -851,7 +1120,7 @@ def _apply_preview_regex(data, task, magic_regex, dir_file_list, preview_account
     # 如果 dir_file_list 未通过并行获取（无 savepath 场景），这里补充获取
     savepath = task.get("savepath", "")
     if savepath and not dir_file_list:
-        savepath_normalized = re.sub(r'/+', '/', savepath)
+        savepath_normalized = _RE_MULTI_SLASH.sub("/", savepath)
         logger.debug(f"[preview_regex] 补充获取目标目录文件列表：{savepath_normalized}")
         try:
             drive_type_key = getattr(preview_account, 'DRIVE_TYPE', 'quark')
@@ -881,7 +1150,7 @@ def _apply_preview_regex(data, task, magic_regex, dir_file_list, preview_account
         except Exception as e:
             logger.warning(f"[preview_regex] 获取目标目录失败：{e}")
 
-    dir_filename_list = [f["file_name"] for f in dir_file_list]
+    dir_filename_list = FileNameList(f["file_name"] for f in dir_file_list)
     logger.debug(f"[preview_regex] 目标目录中有 {len(dir_file_list)} 个文件")
 
     pattern, replace = mr.magic_regex_conv(
@@ -894,6 +1163,9 @@ def _apply_preview_regex(data, task, magic_regex, dir_file_list, preview_account
     compiled_subdir = re.compile(task["update_subdir"]) if task.get("update_subdir") else None
     startfid = task.get("startfid", "")
     ignore_ext = task.get("ignore_extension")
+    # 循环内频繁调用的方法绑定为局部变量
+    mr_sub = mr.sub
+    mr_is_exists = mr.is_exists
 
     for share_file in data["list"]:
         search_re = (
@@ -906,9 +1178,9 @@ def _apply_preview_regex(data, task, magic_regex, dir_file_list, preview_account
             file_name_re = (
                 share_file["file_name"]
                 if share_file["dir"]
-                else mr.sub(pattern, replace, share_file["file_name"])
+                else mr_sub(pattern, replace, share_file["file_name"])
             )
-            if file_name_saved := mr.is_exists(
+            if file_name_saved := mr_is_exists(
                 file_name_re,
                 dir_filename_list,
                 (ignore_ext and not share_file["dir"]),
@@ -921,7 +1193,7 @@ def _apply_preview_regex(data, task, magic_regex, dir_file_list, preview_account
             break
     
     # 文件列表排序
-    if re.search(r"\{I+\}", replace):
+    if _RE_MAGIC_I.search(replace):
         start_index = task.get("sort_index", 1)
         if not start_index or start_index == "":
             start_index = 1
@@ -937,6 +1209,43 @@ def _apply_preview_regex(data, task, magic_regex, dir_file_list, preview_account
     else:
         logger.debug(f"[preview_regex] 未检测到排序变量，跳过排序处理")
 
+def _resolve_savepath(account, dir_names, fid=None):
+    """解析目录 fid 及面包屑，返回 (fid, paths)，路径不存在时 fid 为 None
+
+    适配器支持 get_file_path 时只解析完整路径（已知 fid 则跳过），再一次性取回父链；
+    否则（或父链与路径对不上时）逐级前缀 get_fids。
+    """
+    if hasattr(account, 'get_file_path'):
+        if not fid:
+            get_fids = account.get_fids(["/" + "/".join(dir_names)])
+            fid = get_fids[-1]["fid"] if get_fids else None
+        if not fid:
+            return None, []
+        try:
+            chain = account.get_file_path(fid)
+        except Exception as e:
+            logging.debug(f">>> 获取文件路径失败: {e}")
+            chain = None
+        if chain and len(chain) == len(dir_names) and all(
+            item.get("name") == dir_name for item, dir_name in zip(chain, dir_names)
+        ):
+            return fid, [{"fid": item["fid"], "name": item["name"]} for item in chain]
+
+    path_fids = []
+    current_path = ""
+    for dir_name in dir_names:
+        current_path += "/" + dir_name
+        path_fids.append(current_path)
+    get_fids = account.get_fids(path_fids)
+    if not get_fids:
+        return fid, []
+    paths = [
+        {"fid": get_fid["fid"], "name": dir_name}
+        for get_fid, dir_name in zip(get_fids, dir_names)
+    ]
+    return paths[-1]["fid"], paths
+
+
 @app.route("/get_savepath_detail")
 def get_savepath_detail():
     if not is_login():
@@ -955,71 +1264,20 @@ def get_savepath_detail():
         cookie_key = getattr(account, 'cookie', '')
 
         if path := request.args.get("path"):
-            path = re.sub(r"/+", "/", path)
-            if path == "/":
+            # 折叠多余斜杠，同时得到各级目录名
+            dir_names = [p for p in path.split("/") if p]
+            if not dir_names:
                 fid = 0
             else:
-                dir_names = path.split("/")
-                if dir_names[0] == "":
-                    dir_names.pop(0)
-
-                # 尝试从 adapter 的 savepath_fid 获取最终目录 fid
+                # 尝试从 adapter 的 savepath_fid / 应用级缓存获取最终目录 fid
                 full_path = "/" + "/".join(dir_names)
-                fid = account.savepath_fid.get(full_path)
-
-                if fid:
-                    # savepath_fid 命中，但仍需构建 paths 面包屑
-                    # 无法从缓存重建完整面包屑，走正常流程获取
-                    path_fids = []
-                    current_path = ""
-                    for dir_name in dir_names:
-                        current_path += "/" + dir_name
-                        path_fids.append(current_path)
-                    get_fids = account.get_fids(path_fids)
-                    if get_fids:
-                        fid = get_fids[-1]["fid"]
-                        paths = [
-                            {"fid": get_fid["fid"], "name": dir_name}
-                            for get_fid, dir_name in zip(get_fids, dir_names)
-                        ]
-                else:
-                    # 尝试应用级缓存
-                    fids_cache_key = make_cache_key(drive_type_key, cookie_key, 'fids', full_path)
-                    cached_fid = get_cached_fids(fids_cache_key)
-
-                    if cached_fid:
-                        fid = cached_fid
-                        # 同样需要面包屑，走 get_fids
-                        path_fids = []
-                        current_path = ""
-                        for dir_name in dir_names:
-                            current_path += "/" + dir_name
-                            path_fids.append(current_path)
-                        get_fids = account.get_fids(path_fids)
-                        if get_fids:
-                            fid = get_fids[-1]["fid"]
-                            paths = [
-                                {"fid": get_fid["fid"], "name": dir_name}
-                                for get_fid, dir_name in zip(get_fids, dir_names)
-                            ]
-                    else:
-                        # API 请求
-                        path_fids = []
-                        current_path = ""
-                        for dir_name in dir_names:
-                            current_path += "/" + dir_name
-                            path_fids.append(current_path)
-                        get_fids = account.get_fids(path_fids)
-
-                        if get_fids:
-                            fid = get_fids[-1]["fid"]
-                            set_cached_fids(fids_cache_key, fid)
-                            paths = [
-                                {"fid": get_fid["fid"], "name": dir_name}
-                                for get_fid, dir_name in zip(get_fids, dir_names)
-                            ]
-                        else:
-                            return jsonify({"success": False, "data": {"error": "获取fid失败，请检查路径是否存在"}})
+                fids_cache_key = make_cache_key(drive_type_key, cookie_key, 'fids', full_path)
+                cached_fid = account.savepath_fid.get(full_path) or get_cached_fids(fids_cache_key)
+                fid, paths = _resolve_savepath(account, dir_names, cached_fid)
+                if not fid:
+                    return jsonify({"success": False, "data": {"error": "获取fid失败，请检查路径是否存在"}})
+                if not cached_fid:
+                    set_cached_fids(fids_cache_key, fid)
         else:
             fid = request.args.get("fid", "0")
             logging.info(f">>> get_savepath_detail fid={repr(fid)}, drive_type={drive_type}")
@@ -1130,13 +1388,7 @@ def aliyun_token_refresh():
     account_name = request.json.get("account_name", "")
     
     # 查找对应的账户
-    accounts = config_data.get("accounts", [])
-    target_account = None
-    for acc in accounts:
-        if acc.get("drive_type") == "aliyun":
-            if not account_name or acc.get("name") == account_name:
-                target_account = acc
-                break
+    target_account = find_account("aliyun", account_name)
     
     if not target_account:
         return jsonify({"success": False, "message": "未找到阿里云盘账户"})
@@ -1150,11 +1402,14 @@ def aliyun_token_refresh():
             # 获取新的 refresh_token
             new_token = adapter._refresh_token
             if new_token and new_token != target_account.get("cookie", ""):
-                # 更新配置
-                target_account["cookie"] = new_token
-                Config.write_json(CONFIG_PATH, config_data)
-                # 清除适配器缓存
+                # 更新配置（在磁盘最新配置上只修改该账户的 token）
+                with _config_update_lock:
+                    apply_config_patch(
+                        account_token_patch("aliyun", target_account.get("name", ""), new_token)
+                    )
+                # 清除适配器缓存，并直接复用刚刷新完 token 的实例
                 AdapterFactory.clear_cache()
+                AdapterFactory.cache_adapter("aliyun", new_token, adapter)
                 invalidate_all()  # 同步清空应用级预览缓存
                 
             return jsonify({
@@ -1185,29 +1440,24 @@ def xunlei_token_refresh():
     account_name = request.json.get("account_name", "")
 
     # 查找对应的账户
-    accounts = config_data.get("accounts", [])
-    target_account = None
-    for acc in accounts:
-        if acc.get("drive_type") == "xunlei":
-            if not account_name or acc.get("name") == account_name:
-                target_account = acc
-                break
+    target_account = find_account("xunlei", account_name)
 
     if not target_account:
         return jsonify({"success": False, "message": "未找到迅雷网盘账户"})
 
     try:
-        from adapters.xunlei_adapter import XunleiAdapter
         adapter = XunleiAdapter(target_account.get("cookie", ""), 0, target_account.get("name", ""))
         result = adapter.init()
 
         if result:
             new_token = adapter._refresh_token
             if new_token and new_token != target_account.get("cookie", ""):
-                target_account["cookie"] = new_token
-                target_account["_token_updated_at"] = time.time()
-                Config.write_json(CONFIG_PATH, config_data)
+                with _config_update_lock:
+                    apply_config_patch(
+                        account_token_patch("xunlei", target_account.get("name", ""), new_token)
+                    )
                 AdapterFactory.clear_cache()
+                AdapterFactory.cache_adapter("xunlei", new_token, adapter)
                 invalidate_all()  # 同步清空应用级预览缓存
 
             return jsonify({
@@ -1245,24 +1495,17 @@ def update_account_token():
     if drive_type not in ("aliyun", "xunlei"):
         return jsonify({"success": False, "message": "仅支持阿里云盘和迅雷网盘的 Token 更新"})
 
-    accounts = config_data.get("accounts", [])
-    target_account = None
-    for acc in accounts:
-        if acc.get("drive_type") == drive_type:
-            if not account_name or acc.get("name") == account_name:
-                target_account = acc
-                break
-
-    if not target_account:
-        return jsonify({"success": False, "message": f"未找到对应的{drive_type}账户"})
-
     try:
-        old_token = target_account.get("cookie", "")
-        target_account["cookie"] = new_token
-        target_account["_token_updated_at"] = time.time()
-        Config.write_json(CONFIG_PATH, config_data)
-        # 清除适配器缓存
+        with _config_update_lock:
+            target_account = find_account(drive_type, account_name)
+            if not target_account:
+                return jsonify({"success": False, "message": f"未找到对应的{drive_type}账户"})
+            apply_config_patch(
+                account_token_patch(drive_type, target_account.get("name", ""), new_token)
+            )
+        # 清除适配器缓存，后台预建新 token 的实例
         AdapterFactory.clear_cache()
+        AdapterFactory.warm(drive_type, new_token)
         invalidate_all()  # 同步清空应用级预览缓存
         logging.info(f"[{drive_type}] 账户 {account_name} 的 Token 已手动更新")
         return jsonify({"success": True, "message": "Token 更新成功"})
@@ -1280,20 +1523,21 @@ def add_task():
         return jsonify({"success": False, "code": 1, "message": "未登录"}), 401
     # 必选字段
     request_data = request.json
-    required_fields = ["taskname", "shareurl", "savepath"]
-    for field in required_fields:
-        if field not in request_data or not request_data[field]:
-            return (
-                jsonify(
-                    {"success": False, "code": 2, "message": f"缺少必要字段: {field}"}
-                ),
-                400,
-            )
+    missing = next(
+        (f for f in ("taskname", "shareurl", "savepath") if not request_data.get(f)), None
+    )
+    if missing:
+        return (
+            jsonify(
+                {"success": False, "code": 2, "message": f"缺少必要字段: {missing}"}
+            ),
+            400,
+        )
     if not request_data.get("addition"):
         request_data["addition"] = task_plugins_config_default
     # 添加任务
-    config_data["tasklist"].append(request_data)
-    Config.write_json(CONFIG_PATH, config_data)
+    with _config_update_lock:
+        apply_config_patch(lambda data: data.setdefault("tasklist", []).append(copy.deepcopy(request_data)))
     logging.info(f">>> 通过API添加任务: {request_data['taskname']}")
     return jsonify(
         {"success": True, "code": 0, "message": "任务添加成功", "data": request_data}
@@ -1343,8 +1587,8 @@ def save_sync_tasks():
         return jsonify({"success": False, "message": "未登录"})
     try:
         sync_tasks = request.json.get("sync_tasks", [])
-        config_data["sync_tasks"] = sync_tasks
-        Config.write_json(CONFIG_PATH, config_data)
+        with _config_update_lock:
+            apply_config_patch(lambda data: data.update(sync_tasks=copy.deepcopy(sync_tasks)))
         # 重载同步调度
         if sync_manager:
             sync_manager.reload_sync_tasks(sync_tasks)
@@ -1802,6 +2046,16 @@ def batch_delete_sync_records():
         return jsonify({"success": False, "message": str(e)})
 
 
+def _terminate_timed_out(process):
+    """定时任务超过 TASK_TIMEOUT 仍未结束时终止子进程"""
+    if process.poll() is None:
+        logging.warning(f">>> 任务执行超过 {TASK_TIMEOUT} 秒，终止进程")
+        try:
+            process.terminate()
+        except Exception:
+            pass
+
+
 def run_python(script_path, config_path):
     logging.info(f">>> 定时运行任务")
 
@@ -1814,21 +2068,29 @@ def run_python(script_path, config_path):
             command,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            universal_newlines=True,
-            encoding="utf-8",
-            errors="replace",
-            bufsize=1,
+            bufsize=0,
             env=process_env,
         )
         with _run_procs_lock:
             _run_procs["__scheduler__"] = {"type": "scheduler", "process": process}
-        start = time.time()
-        for line in iter(process.stdout.readline, ""):
-            s = line.rstrip("\n")
-            if s:
-                logging.info(s)
-            if time.time() - start > TASK_TIMEOUT:
-                break
+        # 超时由看门狗计时器终止子进程，子进程长时间无输出时同样生效；
+        # 终止后管道关闭，下面的逐行读取随即结束
+        watchdog = threading.Timer(TASK_TIMEOUT, _terminate_timed_out, args=(process,))
+        watchdog.daemon = True
+        watchdog.start()
+        try:
+            # 按块读取并整块解码，日志仍保持一行一条记录
+            fd = process.stdout.fileno()
+            pending = b""
+            while chunk := os.read(fd, 65536):
+                *lines, pending = (pending + chunk).split(b"\n")
+                for line in b"\n".join(lines).decode("utf-8", "replace").split("\n"):
+                    if line:
+                        logging.info(line)
+            if pending:
+                logging.info(pending.decode("utf-8", "replace"))
+        finally:
+            watchdog.cancel()
         try:
             process.wait(timeout=2)
         except Exception:
@@ -1866,34 +2128,38 @@ def run_python(script_path, config_path):
         logging.debug(f">>> run_python 函数执行完成")
 
 
+@lru_cache(maxsize=32)
+def _cron_trigger(crontab):
+    """按 crontab 表达式缓存解析后的触发器，重复保存同一定时规则时免去重复解析"""
+    return CronTrigger.from_crontab(crontab)
+
+
 # 重新加载任务
 def reload_tasks():
     # 读取定时规则
     if crontab := config_data.get("crontab"):
-        if scheduler.state == 1:
-            scheduler.pause()  # 暂停调度器
-        trigger = CronTrigger.from_crontab(crontab)
-        # 仅移除非同步任务的 jobs（保留 sync_ 前缀的调度）
+        trigger = _cron_trigger(crontab)
+        # 仅移除其他非同步任务的 jobs（保留 sync_ 前缀的调度及主任务本身）
         for job in scheduler.get_jobs():
-            if not job.id.startswith("sync_"):
+            if not job.id.startswith("sync_") and job.id != SCRIPT_PATH:
                 scheduler.remove_job(job.id)
-        scheduler.add_job(
-            run_python,
-            trigger=trigger,
-            args=[SCRIPT_PATH, CONFIG_PATH],
-            id=SCRIPT_PATH,
-            max_instances=1,  # 最多允许1个实例运行
-            coalesce=True,  # 合并错过的任务，避免堆积
-            misfire_grace_time=300,  # 错过任务的宽限期(秒)，超过则跳过
-            replace_existing=True,  # 替换已存在的同ID任务
-        )
-        if scheduler.state == 0:
-            scheduler.start()
-        elif scheduler.state == 2:
-            scheduler.resume()
-        scheduler_state_map = {0: "停止", 1: "运行", 2: "暂停"}
+        job = scheduler.get_job(SCRIPT_PATH)
+        if job is None:
+            scheduler.add_job(
+                run_python,
+                trigger=trigger,
+                args=[SCRIPT_PATH, CONFIG_PATH],
+                id=SCRIPT_PATH,
+                max_instances=1,  # 最多允许1个实例运行
+                coalesce=True,  # 合并错过的任务，避免堆积
+                misfire_grace_time=300,  # 错过任务的宽限期(秒)，超过则跳过
+                replace_existing=True,  # 替换已存在的同ID任务
+            )
+        elif str(job.trigger) != str(trigger):
+            # 已有主任务时仅更换触发器，无需暂停调度器并重建任务
+            scheduler.reschedule_job(SCRIPT_PATH, trigger=trigger)
         logging.info(">>> 重载调度器")
-        logging.info(f"调度状态: {scheduler_state_map[scheduler.state]}")
+        logging.info(f"调度状态: {'运行' if scheduler.running else '停止'}")
         logging.info(f"定时规则: {crontab}")
         logging.info(f"现有任务: {scheduler.get_jobs()}")
         return True
@@ -1927,13 +2193,14 @@ def init():
     logging.info(">>> 初始化配置")
     # 检查配置文件是否存在
     if not os.path.exists(CONFIG_PATH):
-        if not os.path.exists(os.path.dirname(CONFIG_PATH)):
-            os.makedirs(os.path.dirname(CONFIG_PATH))
-        with open("quark_config.json", "rb") as src, open(CONFIG_PATH, "wb") as dest:
-            dest.write(src.read())
+        if config_dir := os.path.dirname(CONFIG_PATH):
+            os.makedirs(config_dir, exist_ok=True)
+        shutil.copyfile("quark_config.json", CONFIG_PATH)
 
     # 读取配置
     config_data = Config.read_json(CONFIG_PATH)
+    # 保留读入时的原样，初始化未改动任何字段时跳过回写
+    loaded_config = copy.deepcopy(config_data)
     Config.breaking_change_update(config_data)
     if not config_data.get("magic_regex"):
         config_data["magic_regex"] = MagicRename().magic_regex
@@ -1962,13 +2229,14 @@ def init():
     config_data["plugins"] = plugins_config_default
 
     # 更新配置
-    Config.write_json(CONFIG_PATH, config_data)
+    if config_data != loaded_config:
+        write_config_cached(copy.deepcopy(config_data))
+    _rebuild_account_index()
     
     # 初始化阿里云盘 token 保存器
     if MULTI_DRIVE_SUPPORT:
         try:
-            from adapters.aliyun_adapter import set_config_saver
-            set_config_saver(CONFIG_PATH)
+            aliyun_set_config_saver(CONFIG_PATH, _make_token_saver("aliyun"))
             logging.info(">>> 阿里云盘 token 保存器已初始化")
         except Exception as e:
             logging.warning(f">>> 初始化阿里云盘 token 保存器失败: {e}")
@@ -1976,8 +2244,9 @@ def init():
     # 初始化迅雷网盘 token 保存器
     if MULTI_DRIVE_SUPPORT:
         try:
-            from adapters.xunlei_adapter import set_config_saver as xunlei_set_config_saver
-            xunlei_set_config_saver(CONFIG_PATH)
+            xunlei_set_config_saver(CONFIG_PATH, _make_token_saver("xunlei"))
+            # 后台提前刷新只在常驻的 WebUI 进程中进行，任务子进程按需同步刷新
+            xunlei_enable_background_refresh()
             logging.info(">>> 迅雷网盘 token 保存器已初始化")
         except Exception as e:
             logging.warning(f">>> 初始化迅雷网盘 token 保存器失败: {e}")
@@ -2017,6 +2286,8 @@ if __name__ == "__main__":
             sync_manager.reload_sync_tasks(sync_tasks)
         except Exception as e:
             logging.warning(f">>> 加载数据同步调度失败: {e}")
+    # 调度器只在此启动一次，之后重载任务仅增改 job，不再切换调度器状态
+    scheduler.start()
     logging.info(">>> 启动Web服务")
     logging.info(f"运行在: http://{HOST}:{PORT}")
     app.run(
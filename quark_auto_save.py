@@ -63,12 +63,23 @@ try:
 except ImportError:
     MULTI_DRIVE_SUPPORT = False
 
+# 可选：orjson 加速配置文件序列化
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # 兼容青龙
 try:
     from treelib import Tree
 except:
     print("正在尝试自动安装依赖...")
-    os.system("pip3 install treelib &> /dev/null")
+    import subprocess
+    subprocess.run(
+        [sys.executable, "-m", "pip", "install", "treelib"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
     from treelib import Tree
 
 
@@ -114,14 +125,48 @@ class Config:
 
     # 读取 JSON 文件内容
     def read_json(config_path):
+        if orjson is not None:
+            with open(config_path, "rb") as f:
+                content = f.read()
+            try:
+                return orjson.loads(content)
+            except orjson.JSONDecodeError:
+                # NaN 等 orjson 不接受的写法交给标准库解析（真正的格式错误仍会抛出）
+                return json.loads(content.decode("utf-8"))
         with open(config_path, "r", encoding="utf-8") as f:
             data = json.load(f)
         return data
 
     # 将数据写入 JSON 文件
     def write_json(config_path, data):
-        with open(config_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, sort_keys=False, indent=2)
+        content = None
+        if orjson is not None:
+            try:
+                # orjson 直接输出 UTF-8 字节，等价于 ensure_ascii=False
+                content = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            except TypeError:
+                # 超出 orjson 支持范围的数据（如超长整数）回退到标准库
+                content = None
+        if content is None:
+            content = json.dumps(data, ensure_ascii=False, sort_keys=False, indent=2).encode("utf-8")
+        # 先写临时文件再原子替换，并发读取方（WebUI、任务子进程）不会读到半截文件
+        tmp_path = f"{config_path}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(content)
+            try:
+                os.chmod(tmp_path, os.stat(config_path).st_mode & 0o7777)
+            except OSError:
+                pass
+            os.replace(tmp_path, config_path)
+        except OSError:
+            # 配置文件被单独挂载等无法替换的情况，退回原地写入
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            with open(config_path, "wb") as f:
+                f.write(content)
 
     # 读取CK
     def get_cookies(cookie_val):
@@ -187,6 +232,24 @@ class Config:
                 task["replace"] = task["replace"].replace("$TASKNAME", "{TASKNAME}")
 
 
+class FileNameList(list):
+    """目录文件名列表：保持原顺序的同时以集合做成员判断（构建后不应再修改）"""
+
+    def __init__(self, names=()):
+        super().__init__(names)
+        self._name_set = set(self)
+        self._stems = None
+
+    def __contains__(self, name):
+        return name in self._name_set
+
+    def stems(self):
+        """去掉扩展名后的文件名列表（首次调用时计算并缓存）"""
+        if self._stems is None:
+            self._stems = FileNameList(os.path.splitext(f)[0] for f in self)
+        return self._stems
+
+
 class MagicRename:
 
     magic_regex = {
@@ -549,7 +612,10 @@ class MagicRename:
         """判断文件是否存在，处理忽略扩展名"""
         if ignore_ext:
             filename = os.path.splitext(filename)[0]
-            filename_list = [os.path.splitext(f)[0] for f in filename_list]
+            if isinstance(filename_list, FileNameList):
+                filename_list = filename_list.stems()
+            else:
+                filename_list = [os.path.splitext(f)[0] for f in filename_list]
         # {I+} 模式，用I通配数字序号
         compiled_i_pattern = self._get_compiled(r"\{I+\}")
         if match := compiled_i_pattern.search(filename):
@@ -1084,7 +1150,7 @@ class Quark:
                 return tree
         to_pdir_fid = self.savepath_fid[savepath]
         dir_file_list = self.ls_dir(to_pdir_fid)["data"]["list"]
-        dir_filename_list = [dir_file["file_name"] for dir_file in dir_file_list]
+        dir_filename_list = FileNameList(dir_file["file_name"] for dir_file in dir_file_list)
         # print("dir_file_list: ", dir_file_list)
 
         tree.create_node(
@@ -1631,8 +1697,9 @@ def dir_check_and_save_with_adapter(adapter, task, pwd_id, stoken, pdir_fid="",
             print(f"❌ 目录 {savepath} fid获取失败，跳过转存")
             return tree
     to_pdir_fid = adapter.savepath_fid[savepath]
-    dir_file_list = adapter.ls_dir(to_pdir_fid)["data"]["list"]
-    dir_filename_list = [dir_file["file_name"] for dir_file in dir_file_list]
+    # 目标目录决定哪些文件需要转存，必须读取最新列表，跳过适配器的目录缓存
+    dir_file_list = adapter.ls_dir(to_pdir_fid, no_cache=True)["data"]["list"]
+    dir_filename_list = FileNameList(dir_file["file_name"] for dir_file in dir_file_list)
 
     tree.create_node(
         savepath,